@@ -0,0 +1,30 @@
+"""
+Shared Anthropic client for the content agents.
+"""
+from functools import lru_cache
+
+import anthropic
+import httpx
+
+from backend.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_client() -> anthropic.Anthropic:
+    """
+    Get the process-wide Anthropic client.
+    
+    Backed by a single HTTP/2 connection pool, so concurrent agent calls
+    multiplex over one connection to api.anthropic.com.
+    """
+    settings = get_settings()
+    http_client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        timeout=60.0,
+    )
+    return anthropic.Anthropic(
+        api_key=settings.anthropic_api_key,
+        max_retries=5,  # SDK backs off with jitter and honors retry-after on 429s
+        http_client=http_client,
+    )
@@ -0,0 +1,14 @@
+"""
+Read JSON replies from Claude (optionally wrapped in a ``` code fence).
+"""
+import re
+
+# Opening fence (with optional "json" tag) up to the closing fence, or to
+# the end of the reply if Claude never closed it
+_JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.DOTALL)
+
+
+def strip_code_fence(content: str) -> str:
+    """Return the reply without a surrounding ```json fence."""
+    match = _JSON_FENCE_RE.match(content)
+    return match.group(1) if match else content.strip()
@@ -1,19 +1,41 @@
 """
 Script Agent - Generates full video scripts from topics.
 """
-import json
-from typing import Optional
+import sys
+from functools import lru_cache
+from typing import TypedDict
 from dataclasses import dataclass, field
 from enum import Enum
 
-import anthropic
+import orjson
 from loguru import logger
 
-from backend.config import get_settings
+from backend.config import BRAND, get_settings
+from backend.agents.client import get_client
+from backend.agents.json_reply import strip_code_fence
 from backend.agents.topic_agent import TopicIdea, ContentType
 
 
-@dataclass
+# Interned segment types; unknown types fall back to "content"
+_SEGMENT_TYPES = {t: sys.intern(t) for t in ("hook", "content", "cta")}
+
+
+class SegmentTD(TypedDict, total=False):
+    """A script segment in the JSON shape Claude returns."""
+    type: str
+    text: str
+    duration_seconds: float
+    visual_cue: str
+
+
+class TTSSegmentTD(TypedDict):
+    """A script segment in the shape TTS processing consumes."""
+    text: str
+    duration: float
+    type: str
+
+
+@dataclass(slots=True)
 class ScriptSegment:
     """A segment of the video script."""
     type: str  # "hook", "content", "cta"
@@ -22,7 +44,7 @@ class ScriptSegment:
     visual_cue: str  # Description of what should be on screen
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoScript:
     """Complete video script with all segments."""
     topic: TopicIdea
@@ -30,12 +52,15 @@ class VideoScript:
     title: str = ""
     description: str = ""
     total_duration_seconds: float = 0
+    full_text: str = ""  # Joined segment text, computed once at parse time
     
     def to_full_text(self) -> str:
         """Get the full script text for TTS."""
-        return " ".join(segment.text for segment in self.segments)
+        if not self.full_text:
+            self.full_text = " ".join([segment.text for segment in self.segments])
+        return self.full_text
     
-    def to_tts_segments(self) -> list[dict]:
+    def to_tts_segments(self) -> list[TTSSegmentTD]:
         """Get segments formatted for TTS processing."""
         return [
             {
@@ -55,8 +80,9 @@ class ScriptAgent:
     
     def __init__(self):
         self.settings = get_settings()
-        self.client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
+        self._system_blocks_cache: dict[str, list[dict]] = {}
     
     def generate_script(
         self,
@@ -74,18 +100,19 @@ class ScriptAgent:
         """
         logger.info(f"Generating script for: {topic.title}")
         
-        system_prompt = self._build_system_prompt(language)
+        system_blocks = self._build_system_blocks(language)
         user_prompt = self._build_user_prompt(topic, target_duration, language)
         
         try:
-            response = self.client.messages.create(
+            with self.client.messages.stream(
                 model=self.model,
-                max_tokens=2000,
-                system=system_prompt,
+                # ~18 output tokens per spoken second plus JSON scaffolding
+                max_tokens=min(1200, 60 + 18 * target_duration),
+                system=system_blocks,
                 messages=[{"role": "user", "content": user_prompt}]
-            )
+            ) as stream:
+                content = "".join(stream.text_stream)
             
-            content = response.content[0].text
             script = self._parse_script(content, topic)
             
             logger.info(f"Generated script: {script.total_duration_seconds}s")
@@ -95,10 +122,36 @@ class ScriptAgent:
             logger.error(f"Failed to generate script: {e}")
             raise
     
-    def _build_system_prompt(self, language: str) -> str:
-        """Build the system prompt for script generation."""
-        lang_instruction = "in het Nederlands" if language == "nl" else "in English"
+    def _build_system_blocks(self, language: str) -> list[dict]:
+        """
+        Build the system prompt as content blocks.
         
+        The static prompt is marked for prompt caching; the per-call
+        language instruction follows as a separate, uncached block so the
+        cached prefix stays identical across languages. The prompt only
+        depends on the language and static settings, so blocks are built
+        once per language and reused.
+        """
+        blocks = self._system_blocks_cache.get(language)
+        if blocks is None:
+            blocks = [
+                {
+                    "type": "text",
+                    "text": self._build_system_prompt(),
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": self._build_language_instruction(language)},
+            ]
+            self._system_blocks_cache[language] = blocks
+        return blocks
+    
+    def _build_language_instruction(self, language: str) -> str:
+        """Build the language instruction for the script."""
+        lang_instruction = "in het Nederlands" if language == "nl" else "in English"
+        return f"Schrijf het script {lang_instruction}."
+    
+    def _build_system_prompt(self) -> str:
+        """Build the static system prompt for script generation."""
         return f"""Je bent een expert scriptwriter voor YouTube Shorts.
 Je schrijft scripts die:
 - Direct de aandacht pakken (eerste 1-2 seconden cruciaal)
@@ -107,9 +160,9 @@ Je schrijft scripts die:
 - Een duidelijke CTA hebben
 
 BRAND CONTEXT:
-- Brand: {self.settings.brand_name}
+- Brand: {BRAND.name}
 - Product: AI-powered sales enablement platform
-- Tagline: {self.settings.brand_tagline}
+- Tagline: {BRAND.tagline}
 - Waarde: Bespaart sales professionals uren aan research en voorbereiding
 
 SCRIPT STRUCTUUR:
@@ -121,7 +174,6 @@ SCHRIJFSTIJL:
 - Conversationeel, niet corporate
 - Kort en krachtig
 - Gebruik cijfers en specifieke voorbeelden
-- {lang_instruction}
 
 OUTPUT FORMAT:
 Geef je antwoord als JSON met deze structuur:
@@ -170,59 +222,64 @@ Denk aan:
 
 Antwoord ALLEEN met JSON, geen andere tekst."""
 
+    def _build_segment(self, seg: SegmentTD) -> ScriptSegment:
+        """Build a ScriptSegment from its JSON object."""
+        return ScriptSegment(
+            type=_SEGMENT_TYPES.get(seg.get("type", "content"), _SEGMENT_TYPES["content"]),
+            text=seg.get("text", ""),
+            duration_seconds=seg.get("duration_seconds", 5),
+            visual_cue=seg.get("visual_cue", "")
+        )
+    
     def _parse_script(self, content: str, topic: TopicIdea) -> VideoScript:
         """Parse the Claude response into a VideoScript object."""
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
+        content = strip_code_fence(content)
         
         try:
-            data = json.loads(content)
+            data = orjson.loads(content)
             
-            segments = []
-            for seg in data.get("segments", []):
-                segment = ScriptSegment(
-                    type=seg.get("type", "content"),
-                    text=seg.get("text", ""),
-                    duration_seconds=seg.get("duration_seconds", 5),
-                    visual_cue=seg.get("visual_cue", "")
-                )
-                segments.append(segment)
+            segments = [self._build_segment(seg) for seg in data.get("segments", [])]
             
             script = VideoScript(
                 topic=topic,
                 segments=segments,
                 title=data.get("title", topic.title),
                 description=data.get("description", ""),
-                total_duration_seconds=data.get("total_duration_seconds", 45)
+                total_duration_seconds=data.get("total_duration_seconds", 45),
+                full_text=" ".join([segment.text for segment in segments])
             )
             
             return script
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse script JSON: {e}")
             logger.debug(f"Raw content: {content}")
             
             # Return a basic script on parse failure
+            text = topic.hook + " " + " ".join(topic.main_points)
             return VideoScript(
                 topic=topic,
                 segments=[
                     ScriptSegment(
                         type="content",
-                        text=topic.hook + " " + " ".join(topic.main_points),
+                        text=text,
                         duration_seconds=45,
                         visual_cue="Main content"
                     )
                 ],
                 title=topic.title,
                 description="",
-                total_duration_seconds=45
+                total_duration_seconds=45,
+                full_text=text
             )
 
 
+@lru_cache(maxsize=1)
+def _get_agent() -> ScriptAgent:
+    """Get the shared ScriptAgent used by the convenience function."""
+    return ScriptAgent()
+
+
 # Convenience function
 def generate_script(
     topic: TopicIdea,
@@ -230,6 +287,5 @@ def generate_script(
     target_duration: int = 45
 ) -> VideoScript:
     """Generate a video script from a topic idea."""
-    agent = ScriptAgent()
-    return agent.generate_script(topic, language, target_duration)
+    return _get_agent().generate_script(topic, language, target_duration)
 
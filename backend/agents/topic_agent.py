@@ -1,15 +1,17 @@
 """
 Topic Agent - Generates content topics and ideas for YouTube shorts.
 """
-import json
+from functools import lru_cache
 from typing import List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
-import anthropic
+import orjson
 from loguru import logger
 
-from backend.config import get_settings
+from backend.config import BRAND, get_settings
+from backend.agents.client import get_client
+from backend.agents.json_reply import strip_code_fence
 
 
 class ContentType(str, Enum):
@@ -20,7 +22,7 @@ class ContentType(str, Enum):
     PRODUCT_SHOWCASE = "product_showcase"
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicIdea:
     """A generated topic idea."""
     content_type: ContentType
@@ -40,8 +42,9 @@ class TopicAgent:
     
     def __init__(self):
         self.settings = get_settings()
-        self.client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
+        self._system_blocks_cache: dict[str, list[dict]] = {}
     
     def generate_topics(
         self, 
@@ -59,19 +62,20 @@ class TopicAgent:
         """
         logger.info(f"Generating {count} topic ideas (type={content_type}, lang={language})")
         
-        system_prompt = self._build_system_prompt(language)
+        system_blocks = self._build_system_blocks(language)
         user_prompt = self._build_user_prompt(content_type, count, language)
         
         try:
-            response = self.client.messages.create(
+            with self.client.messages.stream(
                 model=self.model,
-                max_tokens=2000,
-                system=system_prompt,
+                # ~220 output tokens per topic plus the JSON array wrapper
+                max_tokens=250 + 220 * count,
+                system=system_blocks,
                 messages=[{"role": "user", "content": user_prompt}]
-            )
+            ) as stream:
+                content = "".join(stream.text_stream)
             
             # Parse the response
-            content = response.content[0].text
             topics = self._parse_topics(content)
             
             logger.info(f"Generated {len(topics)} topic ideas")
@@ -81,17 +85,43 @@ class TopicAgent:
             logger.error(f"Failed to generate topics: {e}")
             raise
     
-    def _build_system_prompt(self, language: str) -> str:
-        """Build the system prompt for topic generation."""
-        lang_instruction = "in het Nederlands" if language == "nl" else "in English"
+    def _build_system_blocks(self, language: str) -> List[dict]:
+        """
+        Build the system prompt as content blocks.
         
+        The static prompt is marked for prompt caching; the per-call
+        language instruction follows as a separate, uncached block so the
+        cached prefix stays identical across languages. The prompt only
+        depends on the language and static settings, so blocks are built
+        once per language and reused.
+        """
+        blocks = self._system_blocks_cache.get(language)
+        if blocks is None:
+            blocks = [
+                {
+                    "type": "text",
+                    "text": self._build_system_prompt(),
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": self._build_language_instruction(language)},
+            ]
+            self._system_blocks_cache[language] = blocks
+        return blocks
+    
+    def _build_language_instruction(self, language: str) -> str:
+        """Build the language instruction for the topics."""
+        lang_instruction = "in het Nederlands" if language == "nl" else "in English"
+        return f"Content moet {lang_instruction}."
+    
+    def _build_system_prompt(self) -> str:
+        """Build the static system prompt for topic generation."""
         return f"""Je bent een expert content strategist voor B2B sales content op YouTube.
 Je taak is om virale, engaging topic ideas te genereren voor YouTube Shorts over sales en AI.
 
 CONTEXT:
-- Brand: {self.settings.brand_name}
-- Website: {self.settings.brand_website}
-- Tagline: {self.settings.brand_tagline}
+- Brand: {BRAND.name}
+- Website: {BRAND.website}
+- Tagline: {BRAND.tagline}
 - Target audience: B2B sales professionals (Account Executives, BDRs, Sales Managers)
 
 CONTENT TYPES:
@@ -103,7 +133,6 @@ CONTENT TYPES:
 REQUIREMENTS:
 - Shorts zijn 30-60 seconden
 - Hook moet binnen 1 seconde aandacht pakken
-- Content moet {lang_instruction}
 - Focus op waarde, niet op verkopen
 - Eindig altijd met een CTA naar DealMotion
 
@@ -145,15 +174,10 @@ Antwoord ALLEEN met een JSON array, geen andere tekst."""
     def _parse_topics(self, content: str) -> List[TopicIdea]:
         """Parse the Claude response into TopicIdea objects."""
         # Clean up the response (remove markdown code blocks if present)
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
+        content = strip_code_fence(content)
         
         try:
-            data = json.loads(content)
+            data = orjson.loads(content)
             topics = []
             
             for item in data:
@@ -170,12 +194,18 @@ Antwoord ALLEEN met een JSON array, geen andere tekst."""
             
             return topics
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse topics JSON: {e}")
             logger.debug(f"Raw content: {content}")
             return []
 
 
+@lru_cache(maxsize=1)
+def _get_agent() -> TopicAgent:
+    """Get the shared TopicAgent used by the convenience function."""
+    return TopicAgent()
+
+
 # Convenience function
 def generate_topics(
     content_type: Optional[ContentType] = None,
@@ -183,6 +213,5 @@ def generate_topics(
     language: str = "nl"
 ) -> List[TopicIdea]:
     """Generate topic ideas for YouTube shorts."""
-    agent = TopicAgent()
-    return agent.generate_topics(content_type, count, language)
+    return _get_agent().generate_topics(content_type, count, language)
 
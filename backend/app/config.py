@@ -2,11 +2,23 @@
 Configuration management for DealMotion Marketing Engine.
 """
 import os
+from dataclasses import dataclass
 from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
 
+@dataclass(frozen=True, slots=True)
+class BrandConstants:
+    """Static brand information (identical across environments)."""
+    name: str = "DealMotion"
+    website: str = "https://dealmotion.ai"
+    tagline: str = "Put your deals in motion"
+
+
+BRAND = BrandConstants()
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -16,6 +28,8 @@ class Settings(BaseSettings):
     environment: str = Field(default="development", description="Environment name")
     debug: bool = Field(default=False, description="Debug mode")
     frontend_url: str = Field(default="http://localhost:3000", description="Frontend URL")
+    public_base_url: str = Field(default="", description="Public URL of this API (enables Creatomate render webhooks with CREATOMATE_WEBHOOK_SECRET)")
+    thread_pool_tokens: int = Field(default=100, description="Max threads for blocking endpoint/service calls")
     
     # ==========================================================================
     # Database (Supabase)
@@ -48,6 +62,7 @@ class Settings(BaseSettings):
     # ==========================================================================
     creatomate_api_key: str = Field(default="", description="Creatomate API key")
     creatomate_template_id: str = Field(default="", description="Creatomate template ID for Shorts")
+    creatomate_webhook_secret: str = Field(default="", description="Token Creatomate must echo back on render webhooks")
     
     # ==========================================================================
     # YouTube API
@@ -67,9 +82,6 @@ class Settings(BaseSettings):
     # Content Settings
     # ==========================================================================
     default_language: str = Field(default="nl", description="Default content language")
-    brand_name: str = Field(default="DealMotion", description="Brand name")
-    brand_website: str = Field(default="https://dealmotion.ai", description="Brand website")
-    brand_tagline: str = Field(default="Put your deals in motion", description="Brand tagline")
     
     # ==========================================================================
     # Scheduling
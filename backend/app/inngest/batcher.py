@@ -0,0 +1,95 @@
+"""
+Inngest event batcher - coalesce per-request sends into array sends.
+"""
+import asyncio
+from typing import List, Optional, Tuple
+
+import inngest
+from loguru import logger
+
+from app.inngest.client import inngest_client
+
+
+# Queued by close(): the consumer sends everything ahead of it, then exits
+_STOP = object()
+
+# A queued event and the future its put() call is waiting on
+_Pending = Tuple[inngest.Event, asyncio.Future]
+
+
+class EventBatcher:
+    """
+    Queue events in-process and flush them to Inngest in batches.
+
+    A flush happens once max_size events are pending or max_wait seconds
+    after the first event of a batch arrived, whichever comes first.
+    put() returns once its batch was sent and raises if the send failed.
+    """
+
+    def __init__(self, max_size: int = 100, max_wait: float = 0.2):
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def put(self, event: inngest.Event) -> None:
+        """Queue an event and wait until the batch holding it reached Inngest."""
+        self._ensure_consumer()
+        sent = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, sent))
+        await sent
+
+    def _ensure_consumer(self) -> None:
+        if self._queue is None:
+            # Created lazily so the queue binds to the server's event loop
+            self._queue = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch: List[_Pending] = [item]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    await self._send(batch)
+                    return
+                batch.append(item)
+            await self._send(batch)
+
+    async def _send(self, batch: List[_Pending]) -> None:
+        try:
+            await inngest_client.send([event for event, _ in batch])
+        except Exception as e:
+            logger.exception(f"Failed to send {len(batch)} Inngest event(s)")
+            for _, sent in batch:
+                if not sent.done():
+                    sent.set_exception(e)
+            return
+        for _, sent in batch:
+            if not sent.done():
+                sent.set_result(None)
+
+    async def close(self) -> None:
+        """Flush the batch being collected plus whatever is still queued, then stop."""
+        if self._queue is None:
+            return
+        # Restarts a dead consumer so the queue still gets drained
+        self._ensure_consumer()
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+
+event_batcher = EventBatcher()
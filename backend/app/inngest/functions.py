@@ -13,19 +13,95 @@ COMPLETE PIPELINE:
 NOTE: Using Inngest SDK v0.5+ signature where step is accessed via ctx.step
 """
 import inngest
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache, partial
+from itertools import islice
+from typing import List, Tuple
 from loguru import logger
 
 from app.inngest.client import inngest_client
-from app.config import get_settings
+from app.config import BRAND, get_settings
 from app.services.topic_service import TopicService
 from app.services.script_service import ScriptService
+from app.services.content_service import ContentService
 from app.services.tts_service import TTSService
 from app.services.video_service import VideoService
 from app.services.render_service import RenderService
 from app.services.youtube_service import YouTubeService
 from app.services.database_service import DatabaseService
 
+settings = get_settings()
+
+
+# Services are built once per worker and reused across steps, so their SDK
+# and HTTP clients keep connections alive between step invocations.
+@lru_cache(maxsize=1)
+def _topic_service() -> TopicService:
+    return TopicService()
+
+
+@lru_cache(maxsize=1)
+def _script_service() -> ScriptService:
+    return ScriptService()
+
+
+@lru_cache(maxsize=1)
+def _content_service() -> ContentService:
+    return ContentService()
+
+
+@lru_cache(maxsize=1)
+def _tts_service() -> TTSService:
+    return TTSService()
+
+
+@lru_cache(maxsize=1)
+def _video_service() -> VideoService:
+    return VideoService()
+
+
+@lru_cache(maxsize=1)
+def _render_service() -> RenderService:
+    return RenderService()
+
+
+@lru_cache(maxsize=1)
+def _youtube_service() -> YouTubeService:
+    return YouTubeService()
+
+
+@lru_cache(maxsize=1)
+def _database_service() -> DatabaseService:
+    return DatabaseService()
+
+
+@lru_cache(maxsize=512)
+def _split_text_into_four(full_text: str) -> Tuple[str, str, str, str]:
+    """Split text into 4 parts of roughly equal length, on word boundaries."""
+    n = len(full_text)
+    cuts = [0]
+    for k in (1, 2, 3):
+        # Cut at the first space from each quarter mark (never mid-word)
+        space = full_text.find(" ", n * k // 4)
+        cuts.append(space if space != -1 else n)
+    cuts.append(n)
+    return tuple(full_text[cuts[k]:cuts[k + 1]].strip() for k in range(4))
+
+
+def _four_caption_texts(script: dict) -> List[str]:
+    """Caption texts for the 4 Creatomate scenes of a script."""
+    # Note: Inngest step results may not support Python slicing, so take the
+    # first 4 with islice rather than copying the whole list
+    segments = script.get("segments") or ()
+    texts = [seg.get("text", "") if isinstance(seg, dict) else str(seg) for seg in islice(segments, 4)]
+    
+    # If no segments, split full_text into 4 balanced parts
+    if not texts or all(t == "" for t in texts):
+        return list(_split_text_into_four(script.get("full_text", "") or ""))
+    
+    # Pad to 4 texts
+    return texts + [""] * (4 - len(texts))
+
 
 # =============================================================================
 # Daily Content Pipeline - PAUSED (uncomment trigger to enable)
@@ -33,7 +109,7 @@ from app.services.database_service import DatabaseService
 # @inngest_client.create_function(
 #     fn_id="daily-content-pipeline",
 #     trigger=inngest.TriggerCron(cron="0 10 * * *"),  # 10:00 AM daily
-#     retries=2,
+#     retries=1,  # Claude calls retry in the SDK; this is the outer safety net
 # )
 async def daily_content_pipeline_PAUSED(ctx: inngest.Context) -> dict:
     """
@@ -42,16 +118,16 @@ async def daily_content_pipeline_PAUSED(ctx: inngest.Context) -> dict:
     Generates and publishes configured number of shorts per day.
     """
     step = ctx.step
-    settings = get_settings()
-    db = DatabaseService()
+    db = _database_service()
     
     # Create pipeline run record
     pipeline_run = await step.run(
         "create-pipeline-run",
-        lambda: db.create_pipeline_run()
+        db.create_pipeline_run
     )
     run_id = pipeline_run.get("id")
     
+    scripts_generated = 0
     results = {
         "date": datetime.now().isoformat(),
         "run_id": run_id,
@@ -64,80 +140,99 @@ async def daily_content_pipeline_PAUSED(ctx: inngest.Context) -> dict:
     logger.info("🚀 === Starting Daily Content Pipeline ===")
     
     try:
-        # Step 1: Generate topics
-        topics = await step.run(
-            "generate-topics",
-            lambda: TopicService().generate_topics(
-                count=settings.shorts_per_day,
-                language=settings.default_language
+        # Step 1: Generate topics and their scripts in one Claude call.
+        # With one short per day, reuse today's content if an earlier run
+        # already generated it (re-runs after a failure).
+        today = date.today().isoformat()
+        use_cache = settings.shorts_per_day == 1
+        day = None
+        if use_cache:
+            day = await step.run(
+                "get-cached-day",
+                partial(db.get_cached_day, today, settings.default_language)
             )
-        )
+        if day:
+            logger.info(f"♻️ Reusing cached topics for {today}")
+        else:
+            day = await step.run(
+                "generate-day",
+                partial(
+                    _content_service().generate_day,
+                    count=settings.shorts_per_day,
+                    language=settings.default_language,
+                )
+            )
+            if use_cache and day:
+                await step.run(
+                    "cache-day",
+                    partial(db.cache_day, today, settings.default_language, day)
+                )
+        topics = [item["topic"] for item in day]
+        scripts = [item["script"] for item in day]
         results["topics_generated"] = len(topics)
-        logger.info(f"📝 Generated {len(topics)} topics")
+        logger.info(f"📝 Generated {len(topics)} topics with scripts")
         
-        # Save topics to database
-        saved_topics = []
-        for topic in topics:
-            saved_topic = await step.run(
+        # Save topics to database (independent rows, so in parallel)
+        saved_topics = await step.parallel(tuple(
+            partial(
+                step.run,
                 f"save-topic-{topic.get('id', 'unknown')}",
-                lambda t=topic: db.create_topic(t)
+                partial(db.create_topic, topic),
             )
-            saved_topics.append(saved_topic)
+            for topic in topics
+        ))
         
-        # Update pipeline run
-        await step.run(
-            "update-run-topics",
-            lambda: db.update_pipeline_run(run_id, topics_generated=len(topics))
-        )
+        # Step 2: Save each topic's script, in parallel
+        topic_ids = [topic.get("id", f"topic_{i}") for i, topic in enumerate(saved_topics)]
         
-        # Step 2: Process each topic
-        for i, topic in enumerate(saved_topics):
-            topic_id = topic.get("id", f"topic_{i}")
-            
+        async def save_script(topic_id: str, script: dict):
             try:
-                # Generate script
-                script = await step.run(
-                    f"generate-script-{topic_id}",
-                    lambda t=topic: ScriptService().generate_script(t)
-                )
-                logger.info(f"📜 Script generated for: {topic.get('title')}")
-                
-                # Save script to database
-                saved_script = await step.run(
+                return await step.run(
                     f"save-script-{topic_id}",
-                    lambda s=script, tid=topic_id: db.create_script(s, tid)
-                )
-                
-                # Update pipeline run
-                await step.run(
-                    f"update-run-scripts-{topic_id}",
-                    lambda: db.update_pipeline_run(run_id, scripts_generated=i+1)
+                    partial(db.create_script, script, topic_id)
                 )
-                
-                # Trigger video generation workflow
-                await step.send_event(
-                    "trigger-video-generation",
-                    inngest.Event(
-                        name="marketing/video.generate",
-                        data={
-                            "topic": topic,
-                            "script": script,
-                            "topic_id": topic_id,
-                            "script_id": saved_script.get("id"),
-                            "run_id": run_id,
-                            "upload_after": True
-                        }
-                    )
-                )
-                
             except Exception as e:
                 logger.error(f"❌ Error processing topic {topic_id}: {e}")
                 results["errors"].append(f"Topic {topic_id}: {str(e)}")
+                return None
+        
+        saved_scripts = await step.parallel(tuple(
+            partial(save_script, tid, script)
+            for tid, script in zip(topic_ids, scripts)
+        ))
+        scripts_generated = sum(1 for s in saved_scripts if s)
         
-        # Mark pipeline as completed
+        video_events = [
+            inngest.Event(
+                name="marketing/video.generate",
+                data={
+                    "topic": topic,
+                    "script": script,
+                    "topic_id": topic_id,
+                    "script_id": saved_script.get("id"),
+                    "run_id": run_id,
+                    "upload_after": True
+                }
+            )
+            for topic, topic_id, script, saved_script
+            in zip(saved_topics, topic_ids, scripts, saved_scripts)
+            if saved_script
+        ]
+        
+        # Trigger all video generation workflows in one send
+        if video_events:
+            await step.send_event("trigger-video-generation", video_events)
+        
+        # Mark pipeline as completed, with all counters in one update
         await step.run(
             "complete-pipeline-run",
-            lambda: db.update_pipeline_run(run_id, status="completed")
+            partial(
+                db.update_pipeline_run,
+                run_id,
+                status="completed",
+                topics_generated=results["topics_generated"],
+                scripts_generated=scripts_generated,
+            )
         )
         
     except Exception as e:
@@ -145,7 +240,14 @@ async def daily_content_pipeline_PAUSED(ctx: inngest.Context) -> dict:
         results["errors"].append(str(e))
         await step.run(
             "fail-pipeline-run",
-            lambda: db.update_pipeline_run(run_id, status="failed", errors=[str(e)])
+            partial(
+                db.update_pipeline_run,
+                run_id,
+                status="failed",
+                topics_generated=results["topics_generated"],
+                scripts_generated=scripts_generated,
+                errors=[str(e)],
+            )
         )
     
     logger.info(f"✅ === Pipeline Complete: {results} ===")
@@ -179,28 +281,27 @@ async def generate_video_fn_PAUSED(ctx: inngest.Context) -> dict:
     run_id = data.get("run_id")
     upload_after = data.get("upload_after", True)
     
-    db = DatabaseService()
+    db = _database_service()
     title = topic.get('title', script.get('title', 'Unknown'))
     logger.info(f"🎬 Starting video generation: {title}")
     
-    # Step 1: Generate voice-over
-    logger.info("🎤 Step 1: Generating voice-over...")
-    audio_result = await step.run(
-        "generate-tts",
-        lambda: TTSService().generate_audio(script.get("full_text"))
-    )
+    # Steps 1+2: Voice-over and background video only need the script,
+    # so run them side by side
+    logger.info("🎤🎥 Steps 1-2: Generating voice-over and background video with Veo 2...")
+    audio_result, video_result = await step.parallel((
+        partial(
+            step.run,
+            "generate-tts",
+            partial(_tts_service().generate_audio, script.get("full_text")),
+        ),
+        partial(
+            step.run,
+            "generate-background-video",
+            partial(_video_service().generate_video, script=script),
+        ),
+    ))
     audio_url = audio_result.get("audio_url") if isinstance(audio_result, dict) else audio_result
     logger.info(f"✅ Audio generated: {audio_url}")
-    
-    # Step 2: Generate background video with Veo 2
-    logger.info("🎥 Step 2: Generating background video with Veo 2...")
-    video_result = await step.run(
-        "generate-background-video",
-        lambda: VideoService().generate_video(
-            script=script,
-            audio_url=audio_url
-        )
-    )
     background_video_url = video_result.get("video_url")
     logger.info(f"✅ Background video generated: {background_video_url}")
     
@@ -208,27 +309,12 @@ async def generate_video_fn_PAUSED(ctx: inngest.Context) -> dict:
     logger.info("✨ Step 3: Rendering final video with captions...")
     
     # Extract text segments for Creatomate (4 scenes max)
-    # Note: Inngest step results may not support Python slicing, so convert to list first
-    segments = list(script.get("segments", []) or [])
-    texts = [seg.get("text", "") if isinstance(seg, dict) else str(seg) for seg in segments[:4]]
-    
-    # If no segments, split full_text into 4 parts
-    if not texts or all(t == "" for t in texts):
-        full_text = script.get("full_text", "") or ""
-        words = full_text.split()
-        chunk_size = max(1, len(words) // 4)
-        texts = [
-            " ".join(words[i:i+chunk_size]) 
-            for i in range(0, len(words), chunk_size)
-        ][:4]
-    
-    # Pad to 4 texts
-    while len(texts) < 4:
-        texts.append("")
+    texts = _four_caption_texts(script)
     
     render_result = await step.run(
         "render-final-video",
-        lambda: RenderService().render_simple_short(
+        partial(
+            _render_service().arender_simple_short,
             texts=texts,
             audio_url=audio_url,
             background_video_url=background_video_url,
@@ -240,12 +326,13 @@ async def generate_video_fn_PAUSED(ctx: inngest.Context) -> dict:
     # Step 4: Save video to database
     video_record = await step.run(
         "save-video-to-db",
-        lambda: db.create_video(
+        partial(
+            db.create_video,
             title=title,
             script_id=script_id,
             video_url=final_video_url,
             audio_url=audio_url,
-            duration_seconds=script.get("total_duration_seconds", 25)
+            duration_seconds=script.get("total_duration_seconds", 25),
         )
     )
     video_db_id = video_record.get("id")
@@ -255,7 +342,7 @@ async def generate_video_fn_PAUSED(ctx: inngest.Context) -> dict:
     if run_id:
         await step.run(
             "update-run-videos",
-            lambda: db.update_pipeline_run(run_id, videos_created=1)
+            partial(db.update_pipeline_run, run_id, videos_created=1)
         )
     
     # Step 5: Upload to YouTube
@@ -270,7 +357,7 @@ async def generate_video_fn_PAUSED(ctx: inngest.Context) -> dict:
                     "video_db_id": video_db_id,
                     "run_id": run_id,
                     "title": script.get("title", title),
-                    "description": script.get("description", f"Sales tips van {get_settings().brand_name}"),
+                    "description": script.get("description", f"Sales tips van {BRAND.name}"),
                     "tags": topic.get("hashtags", ["sales", "AI", "B2B"])
                 }
             )
@@ -298,7 +385,7 @@ async def upload_to_youtube_fn_PAUSED(ctx: inngest.Context) -> dict:
     """Upload a video to YouTube and save to database."""
     step = ctx.step
     data = ctx.event.data
-    db = DatabaseService()
+    db = _database_service()
     
     video_db_id = data.get("video_db_id")
     run_id = data.get("run_id")
@@ -307,11 +394,13 @@ async def upload_to_youtube_fn_PAUSED(ctx: inngest.Context) -> dict:
     
     result = await step.run(
         "upload-video",
-        lambda: YouTubeService().upload_video(
+        partial(
+            _youtube_service().upload_video,
             video_url=data.get("video_url"),
             title=data.get("title"),
             description=data.get("description"),
-            tags=data.get("tags", [])
+            tags=data.get("tags", []),
+            privacy_status=data.get("privacy_status", "public"),
         )
     )
     
@@ -323,13 +412,14 @@ async def upload_to_youtube_fn_PAUSED(ctx: inngest.Context) -> dict:
     if video_db_id:
         await step.run(
             "save-youtube-upload",
-            lambda: db.create_youtube_upload(
+            partial(
+                db.create_youtube_upload,
                 video_id=video_db_id,
                 youtube_id=youtube_id,
                 youtube_url=youtube_url,
                 title=data.get("title"),
                 description=data.get("description"),
-                tags=data.get("tags", [])
+                tags=data.get("tags", []),
             )
         )
         logger.info(f"💾 YouTube upload saved to database")
@@ -338,7 +428,7 @@ async def upload_to_youtube_fn_PAUSED(ctx: inngest.Context) -> dict:
     if run_id:
         await step.run(
             "update-run-uploads",
-            lambda: db.update_pipeline_run(run_id, videos_uploaded=1)
+            partial(db.update_pipeline_run, run_id, videos_uploaded=1)
         )
     
     return {
@@ -365,15 +455,13 @@ async def test_full_pipeline_fn_PAUSED(ctx: inngest.Context) -> dict:
     POST /api/inngest with event: marketing/test.full-pipeline
     """
     step = ctx.step
-    db = DatabaseService()
+    db = _database_service()
     logger.info("🧪 === Starting Full Pipeline Test ===")
     
-    settings = get_settings()
-    
     # Create pipeline run record
     pipeline_run = await step.run(
         "test-create-pipeline-run",
-        lambda: db.create_pipeline_run()
+        db.create_pipeline_run
     )
     run_id = pipeline_run.get("id")
     logger.info(f"📊 Pipeline run created: {run_id}")
@@ -381,7 +469,7 @@ async def test_full_pipeline_fn_PAUSED(ctx: inngest.Context) -> dict:
     # Step 1: Generate 1 topic
     topics = await step.run(
         "test-generate-topic",
-        lambda: TopicService().generate_topics(count=1, language="nl")
+        partial(_topic_service().generate_topics, count=1, language="nl")
     )
     topic = topics[0] if topics else {
         "id": "test-topic",
@@ -397,70 +485,53 @@ async def test_full_pipeline_fn_PAUSED(ctx: inngest.Context) -> dict:
     # Save topic to database
     saved_topic = await step.run(
         "test-save-topic",
-        lambda: db.create_topic(topic)
+        partial(db.create_topic, topic)
     )
     topic_id = saved_topic.get("id")
     
-    # Update pipeline run
-    await step.run(
-        "test-update-run-topics",
-        lambda: db.update_pipeline_run(run_id, topics_generated=1)
-    )
-    
     # Step 2: Generate script
     script = await step.run(
         "test-generate-script",
-        lambda: ScriptService().generate_script(topic)
+        partial(_script_service().generate_script, topic)
     )
     logger.info(f"📜 Script generated ({len(script.get('full_text', ''))} chars)")
     
     # Save script to database
     saved_script = await step.run(
         "test-save-script",
-        lambda: db.create_script(script, topic_id)
+        partial(db.create_script, script, topic_id)
     )
     script_id = saved_script.get("id")
     
-    # Update pipeline run
-    await step.run(
-        "test-update-run-scripts",
-        lambda: db.update_pipeline_run(run_id, scripts_generated=1)
-    )
-    
-    # Step 3: Generate audio
-    audio_result = await step.run(
-        "test-generate-audio",
-        lambda: TTSService().generate_audio(script.get("full_text"))
-    )
+    # Steps 3+4: Audio and 4 background video clips for variety don't
+    # depend on each other, so run them side by side
+    logger.info("🎥 Generating audio and 4 video clips (this takes ~10-15 min)...")
+    audio_result, video_clips = await step.parallel((
+        partial(
+            step.run,
+            "test-generate-audio",
+            partial(_tts_service().generate_audio, script.get("full_text")),
+        ),
+        partial(
+            step.run,
+            "test-generate-video-clips",
+            partial(_video_service().generate_multiple_clips, script=script, num_clips=4),
+        ),
+    ))
     audio_url = audio_result.get("audio_url") if isinstance(audio_result, dict) else audio_result
     logger.info(f"🎤 Audio: {audio_url}")
     
-    # Step 4: Generate 4 background video clips for variety
-    logger.info("🎥 Generating 4 video clips (this takes ~10-15 min)...")
-    video_clips = await step.run(
-        "test-generate-video-clips",
-        lambda: VideoService().generate_multiple_clips(script=script, num_clips=4, audio_url=audio_url)
-    )
-    
     # Extract URLs from clips
     background_urls = [clip.get("video_url") for clip in video_clips if clip.get("video_url")]
     logger.info(f"🎥 Generated {len(background_urls)} clips: {background_urls}")
     
     # Step 5: Render final video
-    # Note: Inngest step results may not support Python slicing, so extract list first
-    segments = list(script.get("segments", []) or [])
-    texts = [seg.get("text", "") if isinstance(seg, dict) else str(seg) for seg in segments[:4]]
-    if not texts or all(t == "" for t in texts):
-        full_text = script.get("full_text", "") or ""
-        words = full_text.split()
-        chunk_size = max(1, len(words) // 4)
-        texts = [" ".join(words[i:i+chunk_size]) for i in range(0, len(words), chunk_size)][:4]
-    while len(texts) < 4:
-        texts.append("")
+    texts = _four_caption_texts(script)
     
     render_result = await step.run(
         "test-render-video",
-        lambda: RenderService().render_short(
+        partial(
+            _render_service().arender_short,
             script_segments=[{"text": t} for t in texts],
             audio_url=audio_url,
             background_video_urls=background_urls,  # 4 different clips!
@@ -473,54 +544,47 @@ async def test_full_pipeline_fn_PAUSED(ctx: inngest.Context) -> dict:
     title = script.get("title", topic.get("title"))
     video_record = await step.run(
         "test-save-video",
-        lambda: db.create_video(
+        partial(
+            db.create_video,
             title=title,
             script_id=script_id,
             video_url=final_url,
             audio_url=audio_url,
-            duration_seconds=script.get("total_duration_seconds", 25)
+            duration_seconds=script.get("total_duration_seconds", 25),
         )
     )
     video_db_id = video_record.get("id")
     
-    # Update pipeline run
-    await step.run(
-        "test-update-run-videos",
-        lambda: db.update_pipeline_run(run_id, videos_created=1)
-    )
-    
-    # Step 6: Upload to YouTube (unlisted for testing)
-    youtube_result = await step.run(
-        "test-upload-youtube",
-        lambda: YouTubeService().upload_video(
-            video_url=final_url,
-            title=title,
-            description=script.get("description", "Test video"),
-            tags=topic.get("hashtags", []),
-            privacy_status="unlisted"  # Unlisted for testing
+    # Step 6: Hand the upload (unlisted for testing) to upload_to_youtube_fn,
+    # which also saves the upload and bumps videos_uploaded on the run
+    await step.send_event(
+        "trigger-youtube-upload",
+        inngest.Event(
+            name="marketing/youtube.upload",
+            data={
+                "video_url": final_url,
+                "video_db_id": video_db_id,
+                "run_id": run_id,
+                "title": title,
+                "description": script.get("description", "Test video"),
+                "tags": topic.get("hashtags", []),
+                "privacy_status": "unlisted",
+            }
         )
     )
-    youtube_id = youtube_result.get("youtube_id")
-    youtube_url = youtube_result.get("youtube_url")
-    logger.info(f"📺 YouTube: {youtube_url}")
+    logger.info("📺 YouTube upload queued")
     
-    # Save YouTube upload to database
-    await step.run(
-        "test-save-youtube-upload",
-        lambda: db.create_youtube_upload(
-            video_id=video_db_id,
-            youtube_id=youtube_id,
-            youtube_url=youtube_url,
-            title=title,
-            description=script.get("description", ""),
-            tags=topic.get("hashtags", [])
-        )
-    )
-    
-    # Update pipeline run - completed
+    # Update pipeline run - completed, with all counters in one update
     await step.run(
         "test-complete-pipeline-run",
-        lambda: db.update_pipeline_run(run_id, status="completed", videos_uploaded=1)
+        partial(
+            db.update_pipeline_run,
+            run_id,
+            status="completed",
+            topics_generated=1,
+            scripts_generated=1,
+            videos_created=1,
+        )
     )
     
     logger.info("🎉 === Full Pipeline Test Complete! ===")
@@ -530,8 +594,7 @@ async def test_full_pipeline_fn_PAUSED(ctx: inngest.Context) -> dict:
         "run_id": run_id,
         "topic": topic.get("title"),
         "audio_url": audio_url,
-        "background_video_url": background_url,
+        "background_video_urls": background_urls,
         "final_video_url": final_url,
-        "youtube_url": youtube_url,
-        "youtube_id": youtube_id,
+        "youtube_upload": "queued",
     }
@@ -9,14 +9,20 @@ To re-enable: uncomment @inngest_client.create_function decorators in functions.
 import os
 from contextlib import asynccontextmanager
 
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import inngest
 from inngest.fast_api import serve
+from loguru import logger
 
 from app.config import get_settings
 from app.routers import topics, scripts, videos, youtube, tts, render, pipeline, dashboard
 from app.inngest.client import inngest_client
+from app.inngest.batcher import event_batcher
+from app.services.anthropic_client import aclose_anthropic_clients
+from app.services.http_client import aclose_http_client, close_http_client
 
 # ALL FUNCTIONS PAUSED - No imports needed
 # from app.inngest.functions import (
@@ -31,11 +37,17 @@ from app.inngest.client import inngest_client
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
     # Startup
-    print("🎬 DealMotion Marketing Engine starting...")
-    print("⚠️  INNGEST FUNCTIONS PAUSED - No automatic content generation")
+    # Blocking service calls run in anyio's threadpool; size it for our
+    # I/O-bound workload instead of the default 40 threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_tokens
+    logger.info("🎬 DealMotion Marketing Engine starting (Inngest functions paused)")
     yield
     # Shutdown
-    print("👋 Shutting down...")
+    await event_batcher.close()
+    close_http_client()
+    await aclose_http_client()
+    await aclose_anthropic_clients()
+    logger.info("👋 Shutting down...")
 
 
 # Create FastAPI app
@@ -44,6 +56,7 @@ app = FastAPI(
     description="Automated YouTube content generation for DealMotion",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
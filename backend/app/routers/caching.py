@@ -0,0 +1,53 @@
+"""
+HTTP caching helpers (ETag / Cache-Control) shared by the routers.
+"""
+import hashlib
+from typing import Optional
+
+import orjson
+from fastapi import Request, Response
+
+# Per-user dashboard data: revalidate every time, but allow 304s
+PRIVATE_CACHE_CONTROL = "private, must-revalidate"
+# Stale-tolerant listings that dashboards poll every few seconds
+POLL_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=60"
+# Job status: never served from a cache without asking the server
+STATUS_CACHE_CONTROL = "private, no-cache"
+
+
+def hash_etag(raw: bytes) -> str:
+    """Short quoted ETag for the given bytes."""
+    return '"' + hashlib.blake2b(raw, digest_size=8).hexdigest() + '"'
+
+
+def etag_for(*parts) -> str:
+    """Short quoted ETag from the given parts."""
+    return hash_etag(":".join(str(part) for part in parts).encode())
+
+
+def payload_etag(payload) -> str:
+    """ETag for a JSON-able response body."""
+    return hash_etag(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str))
+
+
+def cache_headers(etag: str, cache_control: str = PRIVATE_CACHE_CONTROL) -> dict:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(
+    request: Request,
+    etag: str,
+    cache_control: str = PRIVATE_CACHE_CONTROL,
+) -> Optional[Response]:
+    """A 304 response if the client already has this version, else None."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers(etag, cache_control))
+    return None
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    cache_control: str = PRIVATE_CACHE_CONTROL,
+) -> None:
+    response.headers.update(cache_headers(etag, cache_control))
@@ -1,31 +1,82 @@
 """
 Dashboard Router - API endpoints for frontend dashboard.
 """
-from typing import Optional
-from fastapi import APIRouter, HTTPException
-
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from app.routers.caching import etag_for, not_modified, payload_etag, set_cache_headers
+from app.routers.errors import internal_error
 from app.services.database_service import DatabaseService
 
 router = APIRouter()
+db = DatabaseService()
+
+# /stats and /content-mix share one stats computation per TTL window
+STATS_TTL_SECONDS = 30
+_stats_lock = asyncio.Lock()
+_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _fresh_stats() -> Optional[Dict[str, Any]]:
+    if _stats_cache and time.monotonic() - _stats_cache[0] < STATS_TTL_SECONDS:
+        return _stats_cache[1]
+    return None
+
+
+async def _get_dashboard_stats() -> Dict[str, Any]:
+    """
+    Dashboard stats, coalesced: concurrent callers wait on the single query
+    already in flight instead of issuing their own.
+    
+    Falls back to zeros when the query fails or returns nothing; those
+    aren't cached, so the next request retries.
+    """
+    global _stats_cache
+    stats = _fresh_stats()
+    if stats is not None:
+        return stats
+    async with _stats_lock:
+        # Another request may have refreshed it while we waited
+        stats = _fresh_stats()
+        if stats is None:
+            stats = await run_in_threadpool(db.get_dashboard_stats)
+            if stats is None:
+                return {"total_videos": 0, "total_views": 0, "videos_this_week": 0, "content_mix": {}}
+            _stats_cache = (time.monotonic(), stats)
+        return stats
 
 
 @router.get("/stats")
-async def get_dashboard_stats():
+async def get_dashboard_stats(request: Request, response: Response):
     """Get aggregated statistics for the dashboard."""
     try:
-        db = DatabaseService()
-        stats = db.get_dashboard_stats()
+        stats = await _get_dashboard_stats()
+        etag = payload_etag(stats)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        set_cache_headers(response, etag)
         return stats
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("get_dashboard_stats failed")
 
 
 @router.get("/videos")
-async def get_recent_videos(limit: int = 10):
+async def get_recent_videos(request: Request, response: Response, limit: int = 10):
     """Get recent videos with YouTube upload data."""
     try:
-        db = DatabaseService()
-        uploads = db.get_youtube_uploads(limit=limit)
+        # Check a cheap fingerprint first so unchanged polls skip the full query
+        fingerprint = await run_in_threadpool(db.get_youtube_uploads_fingerprint)
+        etag = etag_for(fingerprint, limit)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        set_cache_headers(response, etag)
+        
+        uploads = await run_in_threadpool(db.get_youtube_uploads, limit=limit)
         
         # Format for frontend
         videos = []
@@ -45,61 +96,74 @@ async def get_recent_videos(limit: int = 10):
             })
         
         return {"videos": videos}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("get_recent_videos failed")
 
 
 @router.get("/pipeline-runs")
-async def get_pipeline_runs(limit: int = 10):
+async def get_pipeline_runs(request: Request, response: Response, limit: int = 10):
     """Get recent pipeline run history."""
     try:
-        db = DatabaseService()
-        runs = db.get_pipeline_runs(limit=limit)
-        return {"runs": runs}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        runs = await run_in_threadpool(db.get_pipeline_runs, limit=limit)
+        payload = {"runs": runs}
+        etag = payload_etag(payload)
+        cached = not_modified(request, etag)
+        if cached:
+            return cached
+        set_cache_headers(response, etag)
+        return payload
+    except Exception:
+        raise internal_error("get_pipeline_runs failed")
 
 
 @router.get("/pipeline-runs/latest")
 async def get_latest_pipeline_run():
     """Get the most recent pipeline run."""
     try:
-        db = DatabaseService()
-        run = db.get_latest_pipeline_run()
+        run = await run_in_threadpool(db.get_latest_pipeline_run)
         return {"run": run}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("get_latest_pipeline_run failed")
 
 
 @router.get("/content-mix")
 async def get_content_mix():
     """Get content type distribution."""
     try:
-        db = DatabaseService()
-        stats = db.get_dashboard_stats()
+        stats = await _get_dashboard_stats()
         return {"content_mix": stats.get("content_mix", {})}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("get_content_mix failed")
 
 
 @router.get("/topics")
 async def get_recent_topics(limit: int = 10, status: Optional[str] = None):
     """Get recent topics."""
     try:
-        db = DatabaseService()
-        topics = db.get_topics(limit=limit, status=status)
+        topics = await run_in_threadpool(db.get_topics, limit=limit, status=status)
         return {"topics": topics}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("get_recent_topics failed")
 
 
 @router.get("/scripts")
 async def get_recent_scripts(limit: int = 10):
     """Get recent scripts."""
     try:
-        db = DatabaseService()
-        scripts = db.get_scripts(limit=limit)
+        scripts = await run_in_threadpool(db.get_scripts, limit=limit)
         return {"scripts": scripts}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("get_recent_scripts failed")
+
+
+@router.get("/scripts/{script_id}")
+async def get_script(script_id: str):
+    """Get a single script including its segments and full text."""
+    try:
+        script = await run_in_threadpool(db.get_script, script_id)
+    except Exception:
+        raise internal_error("get_script failed")
+    if script is None:
+        raise HTTPException(status_code=404, detail="Script not found")
+    return {"script": script}
 
@@ -0,0 +1,19 @@
+"""
+Error helpers shared by the routers.
+"""
+import uuid
+
+from fastapi import HTTPException
+from loguru import logger
+
+
+def internal_error(message: str) -> HTTPException:
+    """
+    Log the exception being handled and build an opaque 500 response.
+    
+    The client only gets an error id; the traceback stays in the logs
+    under that id.
+    """
+    error_id = uuid.uuid4().hex
+    logger.exception(f"{message} (error_id={error_id})")
+    return HTTPException(status_code=500, detail={"error_id": error_id})
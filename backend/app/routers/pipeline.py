@@ -1,13 +1,15 @@
 """
 Pipeline Router - Trigger and monitor content pipelines.
 """
-from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from loguru import logger
 import inngest
 
+from app.config import get_settings
 from app.inngest.client import inngest_client
+from app.routers.errors import internal_error
 from app.services.topic_service import TopicService
 from app.services.script_service import ScriptService
 from app.services.tts_service import TTSService
@@ -18,6 +20,7 @@ from app.services.database_service import DatabaseService
 
 
 router = APIRouter()
+db = DatabaseService()
 
 
 class PipelineResponse(BaseModel):
@@ -54,13 +57,11 @@ async def trigger_test_pipeline():
         return {
             "status": "triggered",
             "message": "Full pipeline test started. Monitor progress in Inngest dashboard.",
-            "event_ids": result.ids if hasattr(result, 'ids') else [],
+            "event_ids": getattr(result, "ids", []),
         }
         
-    except Exception as e:
-        import traceback
-        error_detail = f"{str(e)}\n{traceback.format_exc()}"
-        raise HTTPException(status_code=500, detail=error_detail)
+    except Exception:
+        raise internal_error("trigger_test_pipeline failed")
 
 
 @router.post("/trigger-daily")
@@ -78,16 +79,12 @@ async def trigger_daily_pipeline():
             "message": "Daily pipeline runs automatically at 10:00 AM via cron. Use /trigger-test for manual testing.",
         }
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("trigger_daily_pipeline failed")
 
 
-@router.get("/status")
-async def get_pipeline_status():
-    """
-    Get the current pipeline status.
-    """
-    from app.config import get_settings
+def _build_pipeline_status() -> dict:
+    """Pipeline status only depends on settings, so build it once."""
     settings = get_settings()
     
     return {
@@ -111,6 +108,18 @@ async def get_pipeline_status():
     }
 
 
+_PIPELINE_STATUS_RESPONSE = _build_pipeline_status()
+
+
+@router.get("/status")
+async def get_pipeline_status(response: Response):
+    """
+    Get the current pipeline status.
+    """
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return _PIPELINE_STATUS_RESPONSE
+
+
 @router.post("/runs/{run_id}/complete")
 async def mark_run_completed(run_id: str):
     """
@@ -118,11 +127,10 @@ async def mark_run_completed(run_id: str):
     Use this when a run succeeded but status wasn't updated due to network issues.
     """
     try:
-        db = DatabaseService()
-        db.update_pipeline_run(run_id, status="completed")
+        await run_in_threadpool(db.update_pipeline_run, run_id, status="completed")
         return {"status": "success", "message": f"Run {run_id} marked as completed"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("mark_run_completed failed")
 
 
 @router.post("/runs/{run_id}/fail")
@@ -131,11 +139,10 @@ async def mark_run_failed(run_id: str):
     Manually mark a stuck run as failed.
     """
     try:
-        db = DatabaseService()
-        db.update_pipeline_run(run_id, status="failed")
+        await run_in_threadpool(db.update_pipeline_run, run_id, status="failed")
         return {"status": "success", "message": f"Run {run_id} marked as failed"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("mark_run_failed failed")
 
 
 @router.post("/cleanup-stuck-runs")
@@ -145,39 +152,15 @@ async def cleanup_stuck_runs():
     Marks them as 'failed' with an appropriate error message.
     """
     try:
-        db = DatabaseService()
-        # Get all running runs
-        runs = db.get_pipeline_runs(limit=50)
-        
-        stuck_count = 0
-        for run in runs:
-            if run.get("status") == "running":
-                # Check if it's been running for more than 10 minutes
-                started_at = run.get("started_at")
-                if started_at:
-                    # Parse ISO format timestamp
-                    try:
-                        if isinstance(started_at, str):
-                            started = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
-                        else:
-                            started = started_at
-                        
-                        now = datetime.now(started.tzinfo) if started.tzinfo else datetime.utcnow()
-                        if (now - started) > timedelta(minutes=10):
-                            db.update_pipeline_run(
-                                run.get("id"), 
-                                status="failed",
-                                errors=["Run timed out or was interrupted"]
-                            )
-                            stuck_count += 1
-                    except Exception as e:
-                        logger.error(f"Error parsing timestamp for run {run.get('id')}: {e}")
+        stuck_ids = await run_in_threadpool(db.mark_stuck_runs_failed, timeout_minutes=10)
+        stuck_count = len(stuck_ids)
         
         return {
             "status": "success", 
             "message": f"Cleaned up {stuck_count} stuck runs",
-            "stuck_runs_fixed": stuck_count
+            "stuck_runs_fixed": stuck_count,
+            "stuck_run_ids": stuck_ids,
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("cleanup_stuck_runs failed")
 
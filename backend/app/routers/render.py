@@ -1,11 +1,12 @@
 """
 Render Router - Create final videos with captions.
 """
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from typing import Any, Dict, List, Literal, Optional
+from fastapi import APIRouter, Body, HTTPException, Query
 from pydantic import BaseModel
 
-from app.services.render_service import RenderService
+from app.routers.errors import internal_error
+from app.services.render_service import RenderService, RenderServiceUnavailable, verify_webhook_token
 
 
 router = APIRouter()
@@ -24,7 +25,7 @@ class RenderResponse(BaseModel):
     """Response for video rendering."""
     render_id: str
     video_url: str
-    status: str
+    status: Literal["completed"]
 
 
 @router.get("/health")
@@ -48,20 +49,46 @@ async def create_render(request: RenderRequest):
             raise HTTPException(status_code=400, detail="At least 1 text segment required")
         
         # Pad to 4 texts if needed
-        texts = request.texts[:4]
-        while len(texts) < 4:
-            texts.append("")
+        texts = (request.texts + ["", "", "", ""])[:4]
         
-        result = render_service.render_simple_short(
+        result = await render_service.arender_simple_short(
             texts=texts,
             audio_url=request.audio_url,
             background_video_url=request.background_video_url,
         )
         
-        return RenderResponse(**result)
+        return RenderResponse.model_construct(**result)
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except RenderServiceUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        raise internal_error("create_render failed")
+
+
+@router.post("/webhook")
+async def creatomate_webhook(render: Dict[str, Any] = Body(...), token: str = Query("")):
+    """
+    Creatomate render-finished callback.
+    
+    Wakes the request or pipeline step awaiting this render, so it
+    doesn't have to poll for the result. Only the render id is taken
+    from the body; the status is re-fetched from Creatomate.
+    """
+    if not verify_webhook_token(token):
+        raise HTTPException(status_code=403, detail="Invalid webhook token")
+    
+    render_id = render.get("id")
+    if not isinstance(render_id, str):
+        raise HTTPException(status_code=400, detail="Missing render id")
+    
+    try:
+        return {"resolved": await render_service.aresolve_webhook(render_id)}
+    except RenderServiceUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception:
+        raise internal_error("creatomate_webhook failed")
 
 
 @router.post("/test")
@@ -81,7 +108,7 @@ async def test_render():
         # Use a sample audio (you can replace this)
         sample_audio = "https://pqegtotvadioslahcxti.supabase.co/storage/v1/object/public/media/audio/20250106_134942_7eab5677.mp3"
         
-        result = render_service.render_simple_short(
+        result = await render_service.arender_simple_short(
             texts=sample_texts,
             audio_url=sample_audio,
         )
@@ -91,6 +118,8 @@ async def test_render():
             "result": result
         }
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except RenderServiceUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception:
+        raise internal_error("test_render failed")
 
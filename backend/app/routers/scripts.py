@@ -2,11 +2,15 @@
 Scripts Router - Generate video scripts from topics.
 """
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from pydantic import BaseModel
 
+from app.routers.errors import internal_error
+from app.services.script_service import ScriptService
+
 
 router = APIRouter()
+script_service = ScriptService()
 
 
 class ScriptSegment(BaseModel):
@@ -45,11 +49,7 @@ async def generate_script(request: ScriptRequest):
     
     Creates an engaging script with hook, content, and CTA segments.
     """
-    from app.services.script_service import ScriptService
-    
     try:
-        service = ScriptService()
-        
         topic_data = {
             "title": request.title,
             "hook": request.hook,
@@ -57,7 +57,7 @@ async def generate_script(request: ScriptRequest):
             "cta": request.cta
         }
         
-        script = service.generate_script(
+        script = await script_service.agenerate_script(
             topic=topic_data,
             language=request.language,
             target_duration=request.target_duration
@@ -65,6 +65,6 @@ async def generate_script(request: ScriptRequest):
         
         return ScriptResponse(**script)
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("generate_script failed")
 
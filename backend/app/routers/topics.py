@@ -2,13 +2,15 @@
 Topics Router - Generate and manage content topics.
 """
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import BaseModel, TypeAdapter
 
+from app.routers.errors import internal_error
 from app.services.topic_service import TopicService, ContentType
 
 
 router = APIRouter()
+topic_service = TopicService()
 
 
 class TopicRequest(BaseModel):
@@ -36,6 +38,10 @@ class TopicsListResponse(BaseModel):
     count: int
 
 
+# Validates a whole list of topic dicts in one pydantic-core pass
+_TOPICS_ADAPTER = TypeAdapter(List[TopicResponse])
+
+
 @router.post("/generate", response_model=TopicsListResponse)
 async def generate_topics(request: TopicRequest):
     """
@@ -45,8 +51,6 @@ async def generate_topics(request: TopicRequest):
     the content type and target language.
     """
     try:
-        service = TopicService()
-        
         content_type = None
         if request.content_type:
             try:
@@ -57,28 +61,36 @@ async def generate_topics(request: TopicRequest):
                     detail=f"Invalid content_type. Must be one of: {[t.value for t in ContentType]}"
                 )
         
-        topics = service.generate_topics(
+        topics = await topic_service.agenerate_topics(
             content_type=content_type,
             count=request.count,
             language=request.language
         )
         
+        validated = _TOPICS_ADAPTER.validate_python(topics)
         return TopicsListResponse(
-            topics=[TopicResponse(**t) for t in topics],
-            count=len(topics)
+            topics=validated,
+            count=len(validated)
         )
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        raise internal_error("generate_topics failed")
+
+
+# Static for the lifetime of the process
+_CONTENT_TYPES_RESPONSE = {
+    "types": [
+        {"id": t.value, "name": t.name.replace("_", " ").title()}
+        for t in ContentType
+    ]
+}
 
 
 @router.get("/types")
-async def get_content_types():
+async def get_content_types(response: Response):
     """Get available content types."""
-    return {
-        "types": [
-            {"id": t.value, "name": t.name.replace("_", " ").title()}
-            for t in ContentType
-        ]
-    }
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return _CONTENT_TYPES_RESPONSE
 
@@ -2,12 +2,17 @@
 TTS Router - Generate voice-overs.
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
+from app.config import get_settings
+from app.routers.errors import internal_error
 from app.services.tts_service import TTSService
 
 
 router = APIRouter()
+tts_service = TTSService()
+settings = get_settings()
 
 
 class TTSRequest(BaseModel):
@@ -35,8 +40,8 @@ async def generate_audio(request: TTSRequest):
     Generate audio from text using ElevenLabs.
     """
     try:
-        service = TTSService()
-        audio_url = service.generate_audio(
+        audio_url = await run_in_threadpool(
+            tts_service.generate_audio,
             text=request.text,
             voice_id=request.voice_id
         )
@@ -48,8 +53,8 @@ async def generate_audio(request: TTSRequest):
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("generate_audio failed")
 
 
 @router.get("/voices")
@@ -58,8 +63,7 @@ async def list_voices():
     Get available ElevenLabs voices.
     """
     try:
-        service = TTSService()
-        voices = service.get_voices()
+        voices = await run_in_threadpool(tts_service.get_voices)
         
         return {
             "voices": [
@@ -73,8 +77,8 @@ async def list_voices():
             "count": len(voices)
         }
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("list_voices failed")
 
 
 @router.get("/test")
@@ -83,16 +87,15 @@ async def test_connection():
     Test ElevenLabs connection.
     """
     try:
-        service = TTSService()
-        voices = service.get_voices()
+        voices = await run_in_threadpool(tts_service.get_voices)
         
         return {
             "status": "connected",
             "voices_available": len(voices)
         }
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Connection failed: {str(e)}")
+    except Exception:
+        raise internal_error("test_connection failed")
 
 
 @router.get("/debug")
@@ -100,9 +103,6 @@ async def debug_config():
     """
     Debug ElevenLabs configuration (safe - no secrets exposed).
     """
-    from app.config import get_settings
-    settings = get_settings()
-    
     api_key = settings.elevenlabs_api_key
     voice_id = settings.elevenlabs_voice_id
     
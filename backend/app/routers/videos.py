@@ -1,16 +1,27 @@
 """
 Videos Router - Generate and manage videos.
 """
-from typing import Optional
-from fastapi import APIRouter, HTTPException
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Literal, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from loguru import logger
 from pydantic import BaseModel
+import inngest
 
-from app.inngest.client import inngest_client
+from app.config import get_settings
+from app.inngest.batcher import event_batcher
+from app.routers.caching import STATUS_CACHE_CONTROL
+from app.routers.errors import internal_error
 from app.services.video_service import VideoService
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 video_service = VideoService()
+settings = get_settings()
 
 
 class VideoGenerateRequest(BaseModel):
@@ -24,17 +35,20 @@ class VideoGenerateRequest(BaseModel):
     upload_after: bool = True
 
 
+VideoStatus = Literal["pending", "queued", "processing", "ready", "failed"]
+
+
 class VideoGenerateResponse(BaseModel):
     """Response for video generation."""
     job_id: str
-    status: str
+    status: VideoStatus
     message: str
 
 
 class VideoStatusResponse(BaseModel):
     """Response for video status."""
     id: str
-    status: str
+    status: VideoStatus
     video_url: Optional[str] = None
     youtube_url: Optional[str] = None
     error: Optional[str] = None
@@ -51,8 +65,9 @@ async def generate_video(request: VideoGenerateRequest):
     3. Optionally uploads to YouTube
     """
     try:
-        # Send event to Inngest
-        await inngest_client.send(
+        # Batched with concurrent requests into one array send; raises if
+        # the send to Inngest failed
+        await event_batcher.put(
             inngest.Event(
                 name="marketing/video.generate",
                 data={
@@ -79,8 +94,8 @@ async def generate_video(request: VideoGenerateRequest):
             message="Video generation started. Check status endpoint for updates."
         )
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("generate_video failed")
 
 
 @router.get("/{video_id}/status", response_model=VideoStatusResponse)
@@ -89,11 +104,19 @@ async def get_video_status(video_id: str):
     Get the status of a video generation job.
     """
     # TODO: Implement with database lookup
-    return VideoStatusResponse(
+    # Returned as a response object so FastAPI skips jsonable_encoder and
+    # response-model revalidation; response_model only documents the shape
+    status = VideoStatusResponse.model_construct(
         id=video_id,
         status="pending",
         video_url=None,
-        youtube_url=None
+        youtube_url=None,
+        error=None,
+    )
+    return Response(
+        content=status.model_dump_json(),
+        media_type="application/json",
+        headers={"Cache-Control": STATUS_CACHE_CONTROL},
     )
 
 
@@ -103,12 +126,12 @@ async def list_videos(limit: int = 20, offset: int = 0):
     List generated videos.
     """
     # TODO: Implement with database
-    return {
+    return ORJSONResponse(content={
         "videos": [],
         "total": 0,
         "limit": limit,
         "offset": offset
-    }
+    })
 
 
 @router.get("/health")
@@ -127,39 +150,59 @@ async def video_debug():
     return video_service.debug_credentials()
 
 
+# The Gemini model catalogue changes rarely; don't re-list it per request
+MODELS_TTL_SECONDS = 3600
+_VIDEO_MODEL_RE = re.compile(r"veo|video|imagen", re.IGNORECASE)
+_models_cache: Dict[str, Tuple[float, dict]] = {}
+
+
+@lru_cache(maxsize=1)
+def _genai_client(api_key: str):
+    """Build the Gemini client once and reuse it across requests."""
+    from google import genai
+    
+    return genai.Client(api_key=api_key)
+
+
+def _list_models(api_key: str) -> dict:
+    """List models via the Gemini API, cached per API key for an hour."""
+    cached = _models_cache.get(api_key)
+    if cached and time.monotonic() - cached[0] < MODELS_TTL_SECONDS:
+        return cached[1]
+    
+    client = _genai_client(api_key)
+    
+    # List all models
+    all_models = []
+    video_models = []
+    
+    for model in client.models.list():
+        name = getattr(model, 'name', str(model))
+        all_models.append(name)
+        
+        # Filter for video-related models
+        if _VIDEO_MODEL_RE.search(name):
+            video_models.append({"name": name})
+    
+    result = {
+        "video_models": video_models,
+        "all_models": all_models[:50],  # First 50 models
+        "total_models": len(all_models)
+    }
+    _models_cache[api_key] = (time.monotonic(), result)
+    return result
+
+
 @router.get("/models")
 async def list_video_models():
     """
     List available video generation models.
     """
     try:
-        from google import genai
-        from app.config import get_settings
-        
-        settings = get_settings()
-        client = genai.Client(api_key=settings.google_gemini_api_key)
-        
-        # List all models
-        all_models = []
-        video_models = []
-        
-        for model in client.models.list():
-            name = getattr(model, 'name', str(model))
-            model_info = {"name": name}
-            all_models.append(name)
-            
-            # Filter for video-related models
-            if 'veo' in name.lower() or 'video' in name.lower() or 'imagen' in name.lower():
-                video_models.append(model_info)
-        
-        return {
-            "video_models": video_models,
-            "all_models": all_models[:50],  # First 50 models
-            "total_models": len(all_models)
-        }
-    except Exception as e:
-        import traceback
-        return {"error": str(e), "traceback": traceback.format_exc()}
+        return await run_in_threadpool(_list_models, settings.google_gemini_api_key)
+    except Exception:
+        logger.exception("Gemini model list failed")
+        raise HTTPException(status_code=503, detail="Model list unavailable")
 
 
 class VideoTestRequest(BaseModel):
@@ -192,6 +235,6 @@ async def test_video_generation(request: VideoTestRequest):
             "result": result
         }
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("test_video_generation failed")
 
@@ -1,12 +1,25 @@
 """
 YouTube Router - Manage YouTube uploads and channel.
 """
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from functools import lru_cache
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from app.routers.caching import POLL_CACHE_CONTROL, cache_headers, not_modified, payload_etag
+from app.routers.errors import internal_error
+from app.services.youtube_service import YouTubeService
 
-router = APIRouter()
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+@lru_cache(maxsize=1)
+def get_youtube_service() -> YouTubeService:
+    """Shared YouTubeService, built on first use."""
+    return YouTubeService()
 
 
 class YouTubeUploadRequest(BaseModel):
@@ -15,7 +28,7 @@ class YouTubeUploadRequest(BaseModel):
     title: str
     description: str
     tags: List[str] = []
-    privacy_status: str = "public"
+    privacy_status: Literal["public", "unlisted", "private"] = "public"
     is_short: bool = True
 
 
@@ -23,7 +36,7 @@ class YouTubeUploadResponse(BaseModel):
     """Response for YouTube upload."""
     youtube_id: str
     youtube_url: str
-    status: str
+    status: Literal["uploaded"]
 
 
 class YouTubeVideoResponse(BaseModel):
@@ -44,12 +57,11 @@ async def upload_video(request: YouTubeUploadRequest):
     
     Requires YouTube API credentials to be configured.
     """
-    from app.services.youtube_service import YouTubeService
-    
     try:
-        service = YouTubeService()
-        
-        result = service.upload_video(
+        # googleapiclient blocks, so YouTube calls run on worker threads
+        # (each with its own thread-local API client)
+        result = await run_in_threadpool(
+            get_youtube_service().upload_video,
             video_url=request.video_url,
             title=request.title,
             description=request.description,
@@ -58,30 +70,39 @@ async def upload_video(request: YouTubeUploadRequest):
             is_short=request.is_short
         )
         
-        return YouTubeUploadResponse(**result)
+        # Serialized straight to JSON by pydantic-core, skipping the
+        # model -> dict -> JSON round trip
+        return Response(
+            content=YouTubeUploadResponse.model_construct(**result).model_dump_json(),
+            media_type="application/json",
+        )
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("upload_video failed")
 
 
 @router.get("/videos")
-async def list_youtube_videos(limit: int = 20):
+async def list_youtube_videos(request: Request, limit: int = 20):
     """
     List videos from the connected YouTube channel.
     """
-    from app.services.youtube_service import YouTubeService
-    
     try:
-        service = YouTubeService()
-        videos = service.get_channel_videos(max_results=limit)
+        videos = await run_in_threadpool(get_youtube_service().get_channel_videos, max_results=limit)
         
-        return {
+        payload = {
             "videos": videos,
             "count": len(videos)
         }
+        # max-age lets polling clients skip the YouTube API call entirely;
+        # the ETag turns revalidations into empty 304s
+        etag = payload_etag(payload)
+        cached = not_modified(request, etag, POLL_CACHE_CONTROL)
+        if cached:
+            return cached
+        return ORJSONResponse(content=payload, headers=cache_headers(etag, POLL_CACHE_CONTROL))
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        raise internal_error("list_youtube_videos failed")
 
 
 @router.get("/channel")
@@ -89,13 +110,11 @@ async def get_channel_info():
     """
     Get connected YouTube channel info.
     """
-    from app.services.youtube_service import YouTubeService
-    
     try:
-        service = YouTubeService()
-        return service.test_connection()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        channel = await run_in_threadpool(get_youtube_service().test_connection)
+        return ORJSONResponse(content=channel)
+    except Exception:
+        raise internal_error("get_channel_info failed")
 
 
 @router.get("/health")
@@ -103,10 +122,7 @@ async def youtube_health():
     """
     Check if YouTube service is configured.
     """
-    from app.services.youtube_service import YouTubeService
-    
-    service = YouTubeService()
-    return service.health_check()
+    return get_youtube_service().health_check()
 
 
 @router.post("/connect")
@@ -1,6 +1,7 @@
 # Services for external API integrations
 from .topic_service import TopicService
 from .script_service import ScriptService
+from .content_service import ContentService
 from .tts_service import TTSService
 from .video_service import VideoService
 from .youtube_service import YouTubeService
@@ -8,6 +9,7 @@ from .youtube_service import YouTubeService
 __all__ = [
     "TopicService",
     "ScriptService", 
+    "ContentService",
     "TTSService",
     "VideoService",
     "YouTubeService",
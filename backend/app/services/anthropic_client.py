@@ -0,0 +1,63 @@
+"""
+Shared Anthropic clients - one pooled HTTP/2 connection set for all Claude calls.
+"""
+import asyncio
+import weakref
+from functools import lru_cache
+
+import anthropic
+import httpx
+from loguru import logger
+
+from app.config import get_settings
+
+_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=50, keepalive_expiry=30.0)
+
+# Async clients hold connections bound to the loop that opened them, so
+# keep one per event loop; entries go away with their loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, anthropic.AsyncAnthropic]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=1)
+def get_anthropic_client() -> anthropic.Anthropic:
+    """Get the process-wide sync Claude client (created on first use)."""
+    return anthropic.Anthropic(
+        api_key=get_settings().anthropic_api_key,
+        max_retries=5,
+        http_client=anthropic.DefaultHttpxClient(http2=True, limits=_LIMITS),
+    )
+
+
+def get_async_anthropic_client() -> anthropic.AsyncAnthropic:
+    """Get the async Claude client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = anthropic.AsyncAnthropic(
+            api_key=get_settings().anthropic_api_key,
+            max_retries=5,
+            http_client=anthropic.DefaultAsyncHttpxClient(http2=True, limits=_LIMITS),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_anthropic_clients() -> None:
+    """Close the shared sync client and the current loop's async client."""
+    if get_anthropic_client.cache_info().currsize:
+        get_anthropic_client().close()
+        get_anthropic_client.cache_clear()
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+def log_prompt_cache(message) -> None:
+    """Debug-log how much of a request's input was served from the prompt cache."""
+    usage = message.usage
+    logger.debug(
+        f"Claude prompt cache: read={usage.cache_read_input_tokens or 0} "
+        f"written={usage.cache_creation_input_tokens or 0} uncached={usage.input_tokens}"
+    )
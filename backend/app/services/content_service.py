@@ -0,0 +1,136 @@
+"""
+Content Service - Generate a day's topics and scripts in one Claude call.
+
+Uses tool calling so Claude returns every topic together with its script
+as one structured `generate_day` tool input, instead of a topic call
+followed by one script call per topic.
+"""
+from functools import lru_cache
+from typing import List, Optional
+
+from loguru import logger
+
+from app.config import get_settings
+from app.services.anthropic_client import get_anthropic_client
+from app.services.topic_service import TopicService, ContentType
+from app.services.script_service import SCRIPT_SCHEMA, ScriptService
+
+
+GENERATE_DAY_TOOL = {
+    "name": "generate_day",
+    "description": "Lever de topics van vandaag, elk met het volledige 8-seconden script.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "topics": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "pain_type": {"type": "string"},
+                        "title": {"type": "string"},
+                        "hook": {"type": "string"},
+                        "scene": {"type": "string"},
+                        "sting": {"type": "string"},
+                        "full_script": {"type": "string"},
+                        "estimated_duration_seconds": {"type": "integer"},
+                        "script": SCRIPT_SCHEMA,
+                    },
+                    "required": ["pain_type", "title", "hook", "scene", "sting", "script"],
+                },
+            },
+        },
+        "required": ["topics"],
+    },
+}
+
+
+class ContentService:
+    """Service for generating topics and their scripts in a single call."""
+    
+    def __init__(self):
+        self.settings = get_settings()
+        self.client = get_anthropic_client()
+        self.model = "claude-sonnet-4-20250514"
+        self.topic_service = TopicService()
+        self.script_service = ScriptService()
+    
+    def generate_day(
+        self,
+        count: int = 1,
+        language: str = "nl",
+        content_type: Optional[ContentType] = None
+    ) -> List[dict]:
+        """
+        Generate `count` topics with their scripts.
+        
+        Returns a list of {"topic": ..., "script": ...} dicts.
+        """
+        logger.info(f"Generating {count} topics with scripts (lang={language})")
+        
+        system = self._system_blocks(language)
+        user_prompt = self._build_user_prompt(content_type, count, language)
+        
+        try:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=count * 900,
+                system=system,
+                tools=[GENERATE_DAY_TOOL],
+                tool_choice={"type": "tool", "name": GENERATE_DAY_TOOL["name"]},
+                messages=[{"role": "user", "content": user_prompt}]
+            )
+            
+            day = self._parse_day(response)
+            logger.info(f"Generated {len(day)} topics with scripts")
+            return day
+            
+        except Exception as e:
+            logger.error(f"Failed to generate topics with scripts: {e}")
+            raise
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _system_blocks(language: str) -> List[dict]:
+        """
+        Topic + script system prompts, built once per language.
+        
+        cache_control on the last block caches the whole shared prefix.
+        """
+        return [
+            {"type": "text", "text": TopicService._build_system_prompt(language)},
+            {
+                "type": "text",
+                "text": ScriptService._build_system_prompt(language),
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
+    
+    def _build_user_prompt(self, content_type: Optional[ContentType], count: int, language: str) -> str:
+        topic_prompt = self.topic_service._build_user_prompt(content_type, count, language)
+        return f"""{topic_prompt}
+
+Schrijf daarna voor ELK topic direct het script volgens de script-regels:
+PRECIES 4 segmenten van ~6 woorden, totaal 25-30 woorden = 8 seconden.
+
+Lever alles via de generate_day tool: elk topic met zijn script in het "script" veld."""
+
+    def _parse_day(self, response) -> List[dict]:
+        tool_input = next(
+            (block.input for block in response.content if block.type == "tool_use"),
+            None
+        )
+        if not tool_input:
+            logger.error("No generate_day tool call in response")
+            return []
+        
+        day = []
+        for item in tool_input.get("topics", []):
+            script_data = item.pop("script", None)
+            topic = self.topic_service._build_topic(item)
+            if script_data:
+                script = self.script_service._build_script(script_data, topic)
+            else:
+                script = self.script_service._fallback_script(topic)
+            day.append({"topic": topic, "script": script})
+        return day
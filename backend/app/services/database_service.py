@@ -1,7 +1,8 @@
 """
 Database Service - Supabase CRUD operations.
 """
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
@@ -11,22 +12,44 @@ from loguru import logger
 from app.config import get_settings
 
 
+# List views only fetch what the dashboard renders; large JSONB/text
+# columns (segments, full_text, main_points) stay in the database
+TOPIC_LIST_COLUMNS = "id,content_type,title,hook,status,created_at"
+SCRIPT_LIST_COLUMNS = "id,topic_id,title,description,total_duration_seconds,language,status,created_at"
+VIDEO_LIST_COLUMNS = "id,script_id,title,video_url,thumbnail_url,duration_seconds,status,created_at"
+PIPELINE_RUN_COLUMNS = (
+    "id,run_date,status,topics_generated,scripts_generated,videos_created,"
+    "videos_uploaded,errors,started_at,completed_at"
+)
+
+# Columns callers may set on insert; everything else (id, status,
+# timestamps, missing optionals) comes from the table defaults
+TOPIC_FIELDS = frozenset({
+    "content_type", "title", "hook", "main_points", "cta", "hashtags",
+    "estimated_duration_seconds", "language",
+})
+SCRIPT_FIELDS = frozenset({
+    "title", "description", "segments", "full_text", "total_duration_seconds", "language",
+})
+
+
+@lru_cache(maxsize=1)
+def get_supabase_client() -> Client:
+    """Process-wide Supabase client, created on first use."""
+    settings = get_settings()
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_service_key or settings.supabase_anon_key
+    )
+
+
 class DatabaseService:
     """Service for database operations via Supabase."""
     
-    def __init__(self):
-        self.settings = get_settings()
-        self._client: Optional[Client] = None
-    
     @property
     def client(self) -> Client:
-        """Lazy-loaded Supabase client."""
-        if self._client is None:
-            self._client = create_client(
-                self.settings.supabase_url,
-                self.settings.supabase_service_key or self.settings.supabase_anon_key
-            )
-        return self._client
+        """Shared Supabase client (one connection pool for all instances)."""
+        return get_supabase_client()
     
     # =========================================================================
     # TOPICS
@@ -34,24 +57,26 @@ class DatabaseService:
     
     def create_topic(self, topic: Dict[str, Any]) -> Dict[str, Any]:
         """Save a generated topic to database."""
-        data = {
-            "content_type": topic.get("content_type", "sales_tip"),
-            "title": topic.get("title", ""),
-            "hook": topic.get("hook", ""),
-            "main_points": topic.get("main_points", []),
-            "cta": topic.get("cta", ""),
-            "hashtags": topic.get("hashtags", []),
-            "estimated_duration_seconds": topic.get("estimated_duration_seconds", 25),
-            "language": topic.get("language", "nl"),
-            "status": "pending",
-        }
+        # Only send what the caller provided; Postgres fills in the rest.
+        # content_type and duration are set here: databases created before
+        # the schema.sql defaults have none for content_type and 45s durations
+        data = {k: v for k, v in topic.items() if k in TOPIC_FIELDS}
+        data.setdefault("title", "")
+        data.setdefault("hook", "")
+        data.setdefault("content_type", "sales_tip")
+        data.setdefault("estimated_duration_seconds", 25)
         result = self.client.table("topics").insert(data).execute()
         logger.info(f"Created topic: {data['title']}")
         return result.data[0] if result.data else data
     
-    def get_topics(self, limit: int = 10, status: Optional[str] = None) -> List[Dict]:
+    def get_topics(
+        self,
+        limit: int = 10,
+        status: Optional[str] = None,
+        columns: str = TOPIC_LIST_COLUMNS,
+    ) -> List[Dict]:
         """Get recent topics."""
-        query = self.client.table("topics").select("*").order("created_at", desc=True).limit(limit)
+        query = self.client.table("topics").select(columns).order("created_at", desc=True).limit(limit)
         if status:
             query = query.eq("status", status)
         result = query.execute()
@@ -61,31 +86,71 @@ class DatabaseService:
         """Update topic status."""
         self.client.table("topics").update({"status": status}).eq("id", topic_id).execute()
     
+    # =========================================================================
+    # TOPIC CACHE
+    # =========================================================================
+    
+    def get_cached_day(
+        self,
+        run_date: str,
+        language: str,
+        content_type: str = "mixed",
+    ) -> Optional[List[Dict]]:
+        """Get the topics + scripts already generated for a day, if any."""
+        try:
+            result = self.client.table("topic_cache").select("items") \
+                .eq("run_date", run_date) \
+                .eq("language", language) \
+                .eq("content_type", content_type) \
+                .limit(1).execute()
+            return result.data[0].get("items") if result.data else None
+        except Exception as e:
+            logger.error(f"Failed to get cached topics: {e}")
+            return None
+    
+    def cache_day(
+        self,
+        run_date: str,
+        language: str,
+        items: List[Dict],
+        content_type: str = "mixed",
+    ) -> None:
+        """Store the topics + scripts generated for a day."""
+        data = {
+            "run_date": run_date,
+            "language": language,
+            "content_type": content_type,
+            "items": items,
+        }
+        self.client.table("topic_cache").upsert(
+            data, on_conflict="run_date,language,content_type"
+        ).execute()
+        logger.info(f"Cached {len(items)} topics for {run_date} ({language})")
+    
     # =========================================================================
     # SCRIPTS
     # =========================================================================
     
     def create_script(self, script: Dict[str, Any], topic_id: Optional[str] = None) -> Dict[str, Any]:
         """Save a generated script to database."""
-        data = {
-            "topic_id": topic_id,
-            "title": script.get("title", ""),
-            "description": script.get("description", ""),
-            "segments": script.get("segments", []),
-            "full_text": script.get("full_text", ""),
-            "total_duration_seconds": script.get("total_duration_seconds", 25),
-            "language": script.get("language", "nl"),
-            "status": "pending",
-        }
+        data = {k: v for k, v in script.items() if k in SCRIPT_FIELDS}
+        data["topic_id"] = topic_id
+        data.setdefault("title", "")
+        data.setdefault("total_duration_seconds", 25)
         result = self.client.table("scripts").insert(data).execute()
         logger.info(f"Created script: {data['title']}")
         return result.data[0] if result.data else data
     
-    def get_scripts(self, limit: int = 10) -> List[Dict]:
-        """Get recent scripts."""
-        result = self.client.table("scripts").select("*").order("created_at", desc=True).limit(limit).execute()
+    def get_scripts(self, limit: int = 10, columns: str = SCRIPT_LIST_COLUMNS) -> List[Dict]:
+        """Get recent scripts (without segments/full_text; see get_script)."""
+        result = self.client.table("scripts").select(columns).order("created_at", desc=True).limit(limit).execute()
         return result.data or []
     
+    def get_script(self, script_id: str) -> Optional[Dict]:
+        """Get a single script with all of its columns."""
+        result = self.client.table("scripts").select("*").eq("id", script_id).limit(1).execute()
+        return result.data[0] if result.data else None
+    
     # =========================================================================
     # VIDEOS
     # =========================================================================
@@ -115,9 +180,14 @@ class DatabaseService:
         """Update video record."""
         self.client.table("videos").update(updates).eq("id", video_id).execute()
     
-    def get_videos(self, limit: int = 10, status: Optional[str] = None) -> List[Dict]:
+    def get_videos(
+        self,
+        limit: int = 10,
+        status: Optional[str] = None,
+        columns: str = VIDEO_LIST_COLUMNS,
+    ) -> List[Dict]:
         """Get recent videos."""
-        query = self.client.table("videos").select("*").order("created_at", desc=True).limit(limit)
+        query = self.client.table("videos").select(columns).order("created_at", desc=True).limit(limit)
         if status:
             query = query.eq("status", status)
         result = query.execute()
@@ -170,6 +240,22 @@ class DatabaseService:
             "comments": comments,
         }).eq("youtube_id", youtube_id).execute()
     
+    def get_youtube_uploads_fingerprint(self) -> str:
+        """
+        Cheap change marker for the uploads listing: latest updated_at + row
+        count of youtube_uploads, plus the latest updated_at of videos (the
+        listing embeds video fields such as thumbnail_url).
+        """
+        result = self.client.table("youtube_uploads").select(
+            "updated_at", count="exact"
+        ).order("updated_at", desc=True).limit(1).execute()
+        latest = result.data[0].get("updated_at") if result.data else ""
+        videos = self.client.table("videos").select(
+            "updated_at"
+        ).order("updated_at", desc=True).limit(1).execute()
+        videos_latest = videos.data[0].get("updated_at") if videos.data else ""
+        return f"{latest}:{result.count or 0}:{videos_latest}"
+    
     # =========================================================================
     # PIPELINE RUNS
     # =========================================================================
@@ -215,10 +301,21 @@ class DatabaseService:
         if updates:
             self.client.table("pipeline_runs").update(updates).eq("id", run_id).execute()
     
-    def get_pipeline_runs(self, limit: int = 10) -> List[Dict]:
+    def mark_stuck_runs_failed(self, timeout_minutes: int = 10) -> List[str]:
+        """Fail every run still 'running' after timeout_minutes, in one UPDATE."""
+        now = datetime.utcnow()
+        cutoff = (now - timedelta(minutes=timeout_minutes)).isoformat()
+        result = self.client.table("pipeline_runs").update({
+            "status": "failed",
+            "errors": ["Run timed out or was interrupted"],
+            "completed_at": now.isoformat(),
+        }).eq("status", "running").lt("started_at", cutoff).execute()
+        return [run["id"] for run in (result.data or [])]
+    
+    def get_pipeline_runs(self, limit: int = 10, columns: str = PIPELINE_RUN_COLUMNS) -> List[Dict]:
         """Get recent pipeline runs."""
         try:
-            result = self.client.table("pipeline_runs").select("*").order("created_at", desc=True).limit(limit).execute()
+            result = self.client.table("pipeline_runs").select(columns).order("created_at", desc=True).limit(limit).execute()
             return result.data or []
         except Exception as e:
             logger.error(f"Failed to get pipeline runs: {e}")
@@ -227,7 +324,7 @@ class DatabaseService:
     def get_latest_pipeline_run(self) -> Optional[Dict]:
         """Get the most recent pipeline run."""
         try:
-            result = self.client.table("pipeline_runs").select("*").order("created_at", desc=True).limit(1).execute()
+            result = self.client.table("pipeline_runs").select(PIPELINE_RUN_COLUMNS).order("created_at", desc=True).limit(1).execute()
             return result.data[0] if result.data else None
         except Exception as e:
             logger.error(f"Failed to get latest pipeline run: {e}")
@@ -237,44 +334,52 @@ class DatabaseService:
     # DASHBOARD STATS
     # =========================================================================
     
-    def get_dashboard_stats(self) -> Dict[str, Any]:
-        """Get aggregated stats for dashboard."""
+    def get_dashboard_stats(self) -> Optional[Dict[str, Any]]:
+        """Get aggregated stats for dashboard (None if the queries failed or came back empty)."""
+        week_ago = (datetime.utcnow() - timedelta(days=7)).isoformat()
         try:
-            # Total videos
-            videos_result = self.client.table("videos").select("id", count="exact").execute()
-            total_videos = videos_result.count or 0
-            
-            # Total views (sum from youtube_uploads)
-            uploads_result = self.client.table("youtube_uploads").select("views").execute()
-            total_views = sum(u.get("views", 0) for u in (uploads_result.data or []))
-            
-            # Videos this week
-            week_ago = (datetime.utcnow().date().isoformat())
-            week_videos = self.client.table("videos").select("id", count="exact").gte("created_at", week_ago).execute()
-            videos_this_week = week_videos.count or 0
-            
-            # Content type distribution - dynamically count all types
-            content_mix_result = self.client.table("topics").select("content_type").execute()
-            mix: Dict[str, int] = {}
-            for t in (content_mix_result.data or []):
-                ct = t.get("content_type", "unknown")
-                mix[ct] = mix.get(ct, 0) + 1
-            
-            return {
-                "total_videos": total_videos,
-                "total_views": total_views,
-                "videos_this_week": videos_this_week,
-                "content_mix": mix,
-            }
+            # All aggregates are computed in Postgres (see get_dashboard_stats
+            # in database/schema.sql), so only one small row comes back
+            result = self.client.rpc("get_dashboard_stats", {"week_start": week_ago}).execute()
         except Exception as e:
-            logger.error(f"Failed to get dashboard stats: {e}")
-            # Return safe defaults instead of crashing
-            return {
-                "total_videos": 0,
-                "total_views": 0,
-                "videos_this_week": 0,
-                "content_mix": {},
-            }
+            # Projects without database/migrations/001_* don't have the RPC yet
+            logger.warning(f"get_dashboard_stats RPC failed, using per-table queries: {e}")
+            try:
+                return self._query_dashboard_stats(week_ago)
+            except Exception as e:
+                logger.error(f"Failed to get dashboard stats: {e}")
+                return None
+        
+        stats = result.data
+        if not stats:
+            return None
+        return {
+            "total_videos": stats.get("total_videos", 0),
+            "total_views": stats.get("total_views", 0),
+            "videos_this_week": stats.get("videos_this_week", 0),
+            "content_mix": stats.get("content_mix") or {},
+        }
+    
+    def _query_dashboard_stats(self, week_ago: str) -> Dict[str, Any]:
+        """Dashboard stats from plain table queries (slower fallback for the RPC)."""
+        videos_result = self.client.table("videos").select("id", count="exact").execute()
+        uploads_result = self.client.table("youtube_uploads").select("views").execute()
+        week_videos = self.client.table("videos").select(
+            "id", count="exact"
+        ).gte("created_at", week_ago).execute()
+        content_mix_result = self.client.table("topics").select("content_type").execute()
+        
+        mix: Dict[str, int] = {}
+        for t in (content_mix_result.data or []):
+            ct = t.get("content_type") or "unknown"
+            mix[ct] = mix.get(ct, 0) + 1
+        
+        return {
+            "total_videos": videos_result.count or 0,
+            "total_views": sum(u.get("views") or 0 for u in (uploads_result.data or [])),
+            "videos_this_week": week_videos.count or 0,
+            "content_mix": mix,
+        }
     
     # =========================================================================
     # CONTENT PIPELINE VIEW
@@ -0,0 +1,40 @@
+"""
+Shared HTTP client - one keep-alive connection pool for outbound API calls.
+"""
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Get the process-wide HTTP client (created on first use)."""
+    return httpx.Client(
+        http2=True,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=200),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client (created on first use)."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=200),
+    )
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client if it was ever created."""
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+        get_http_client.cache_clear()
+
+
+async def aclose_http_client() -> None:
+    """Close the shared async HTTP client if it was ever created."""
+    if get_async_http_client.cache_info().currsize:
+        await get_async_http_client().aclose()
+        get_async_http_client.cache_clear()
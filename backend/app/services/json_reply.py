@@ -0,0 +1,31 @@
+"""
+Read JSON replies from Claude (optionally wrapped in a ``` code fence).
+"""
+import re
+from typing import Any
+
+import orjson
+
+# Opening fence (with optional "json" tag) up to the closing fence, or to
+# the end of the reply if Claude never closed it
+_JSON_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.DOTALL)
+
+# orjson's error subclasses json.JSONDecodeError, so callers can keep
+# catching either
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def reply_text(message) -> str:
+    """All text blocks of a Claude message, joined (it may return several)."""
+    return "".join(block.text for block in message.content if block.type == "text")
+
+
+def strip_code_fence(content: str) -> str:
+    """Return the reply without a surrounding ```json fence."""
+    match = _JSON_FENCE_RE.match(content)
+    return match.group(1) if match else content.strip()
+
+
+def loads_reply(content: str) -> Any:
+    """Strip any code fence and parse the reply with orjson."""
+    return orjson.loads(strip_code_fence(content))
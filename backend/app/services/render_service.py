@@ -1,23 +1,132 @@
 """
 Render Service - Create final videos with Creatomate (audio + video + captions).
 """
+import asyncio
+import hmac
+import random
 import time
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
 import httpx
-from typing import List, Optional
+import orjson
 from loguru import logger
 
 from app.config import get_settings
+from app.services.http_client import get_async_http_client
 from app.services.storage_service import StorageService
 
 
+# Render polling backoff: 2s, 3s, 4.5s, ... capped at 15s, with +-10% jitter
+# so concurrent renders don't poll Creatomate in lockstep
+POLL_BASE_SECONDS = 2.0
+POLL_MAX_SECONDS = 15.0
+
+
+def _poll_interval(attempt: int) -> float:
+    """Seconds to wait before the next render status check."""
+    interval = min(POLL_MAX_SECONDS, POLL_BASE_SECONDS * 1.5 ** attempt)
+    return interval * random.uniform(0.9, 1.1)
+
+
+RENDER_DONE_STATUSES = ("succeeded", "failed")
+
+# Async renders waiting in this process, keyed by Creatomate render id
+_pending_renders: Dict[str, asyncio.Future] = {}
+
+
+def verify_webhook_token(token: str) -> bool:
+    """Check a webhook's token against CREATOMATE_WEBHOOK_SECRET (constant time)."""
+    secret = get_settings().creatomate_webhook_secret
+    return bool(secret) and hmac.compare_digest(token.encode(), secret.encode())
+
+
+class RenderServiceUnavailable(Exception):
+    """Creatomate keeps failing; calls are rejected until the breaker resets."""
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an upstream API is down.
+    
+    Opens after fail_max consecutive failures within window seconds, then
+    rejects calls for reset_timeout seconds before letting a single trial
+    call through. The trial's outcome closes or re-opens the circuit.
+    Only touched from the event loop, so it needs no lock.
+    """
+    
+    def __init__(self, fail_max: int = 5, window: float = 60.0, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._first_failure_at = 0.0
+        self._opened_at: Optional[float] = None
+        self._half_open = False
+    
+    def before_call(self) -> None:
+        if self._opened_at is None:
+            return
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            raise RenderServiceUnavailable("Creatomate is unavailable, try again shortly")
+        # Half-open: this call is the trial; the rest keep failing fast
+        # until it reports back (or for another reset_timeout if it never does)
+        self._half_open = True
+        self._opened_at = now
+    
+    def record_response(self, response: httpx.Response) -> None:
+        if response.status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+    
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+    
+    def record_failure(self) -> None:
+        now = time.monotonic()
+        if self._half_open:
+            self._half_open = False
+            self._opened_at = now
+            logger.warning("Creatomate circuit re-opened after a failed trial call")
+            return
+        if self._failures == 0 or now - self._first_failure_at > self.window:
+            self._failures = 0
+            self._first_failure_at = now
+        self._failures += 1
+        if self._failures >= self.fail_max and self._opened_at is None:
+            self._opened_at = now
+            logger.warning(f"Creatomate circuit opened after {self._failures} failures")
+
+
+_breaker = CircuitBreaker()
+
+
 class RenderService:
     """Service for rendering final videos with Creatomate."""
     
     BASE_URL = "https://api.creatomate.com/v1"
     
+    # Template element keys for the 4 scenes
+    _BG_KEYS = tuple(f"Background-{i}.source" for i in range(1, 5))
+    _TEXT_KEYS = tuple(f"Text-{i}.text" for i in range(1, 5))
+    
     def __init__(self):
         self.settings = get_settings()
         self.storage = StorageService()
+        self._headers = {
+            "Authorization": f"Bearer {self.settings.creatomate_api_key}",
+        }
+        # Render payloads are encoded with orjson and sent as raw bytes
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
+        # The token lets the webhook endpoint reject callbacks we didn't ask for
+        self._webhook_url = (
+            f"{self.settings.public_base_url.rstrip('/')}/api/render/webhook?"
+            + urlencode({"token": self.settings.creatomate_webhook_secret})
+            if self.settings.public_base_url and self.settings.creatomate_webhook_secret else None
+        )
     
     def health_check(self) -> dict:
         """Check if Creatomate is configured."""
@@ -27,7 +136,7 @@ class RenderService:
             "template_id": self.settings.creatomate_template_id or "not set",
         }
     
-    def render_short(
+    async def arender_short(
         self,
         script_segments: List[dict],
         audio_url: str,
@@ -38,6 +147,9 @@ class RenderService:
         """
         Render a YouTube Short with animated captions.
         
+        Waits on Creatomate without holding a worker thread, so many
+        renders can be supervised from the event loop.
+        
         Args:
             script_segments: List of text segments with timing
             audio_url: URL to the voice-over audio
@@ -48,6 +160,31 @@ class RenderService:
         Returns:
             dict with render_id and video_url
         """
+        modifications = self._prepare_render(
+            script_segments=script_segments,
+            audio_url=audio_url,
+            background_video_url=background_video_url,
+            background_video_urls=background_video_urls,
+            music_url=music_url,
+        )
+        
+        render_response = await self._astart_render(modifications)
+        render_id = render_response.get("id")
+        
+        logger.info(f"Render started: {render_id}")
+        
+        result = await self._await_render(render_id)
+        return self._render_result(render_id, result)
+    
+    def _prepare_render(
+        self,
+        script_segments: List[dict],
+        audio_url: str,
+        background_video_url: Optional[str],
+        background_video_urls: Optional[List[str]],
+        music_url: Optional[str],
+    ) -> dict:
+        """Validate configuration and build the template modifications."""
         if not self.settings.creatomate_api_key:
             raise ValueError("CREATOMATE_API_KEY not configured")
         
@@ -57,23 +194,16 @@ class RenderService:
         logger.info(f"🎬 Starting Creatomate render with {len(script_segments)} segments")
         
         # Build modifications for the template
-        modifications = self._build_modifications(
+        return self._build_modifications(
             script_segments=script_segments,
             audio_url=audio_url,
             background_video_url=background_video_url,
             background_video_urls=background_video_urls,
             music_url=music_url,
         )
-        
-        # Start render
-        render_response = self._start_render(modifications)
-        render_id = render_response.get("id")
-        
-        logger.info(f"Render started: {render_id}")
-        
-        # Poll for completion
-        result = self._wait_for_render(render_id)
-        
+    
+    def _render_result(self, render_id: str, result: dict) -> dict:
+        """Turn a finished render into our response dict (or raise)."""
         if result.get("status") == "succeeded":
             video_url = result.get("url")
             logger.info(f"✅ Render completed: {video_url}")
@@ -108,89 +238,133 @@ class RenderService:
         # Add background videos
         if background_video_urls and len(background_video_urls) > 0:
             # Multiple clips - each scene gets its own video (variety!)
-            for i in range(1, 5):
+            clip_count = len(background_video_urls)
+            for i, key in enumerate(self._BG_KEYS):
                 # Use modulo to cycle through available clips if fewer than 4
-                clip_index = (i - 1) % len(background_video_urls)
-                modifications[f"Background-{i}.source"] = background_video_urls[clip_index]
+                modifications[key] = background_video_urls[i % clip_count]
             logger.info(f"Using {len(background_video_urls)} different video clips for scenes")
         elif background_video_url:
             # Single video - apply to all scenes (legacy)
-            for i in range(1, 5):
-                modifications[f"Background-{i}.source"] = background_video_url
+            for key in self._BG_KEYS:
+                modifications[key] = background_video_url
             logger.info("Using single video for all scenes")
         
         # Add text segments (animated captions)
-        for i, segment in enumerate(script_segments[:4], start=1):
-            text = segment.get("text", "")
-            modifications[f"Text-{i}.text"] = text
+        for key, segment in zip(self._TEXT_KEYS, script_segments):
+            modifications[key] = segment.get("text", "")
         
         logger.info(f"Creatomate modifications: {list(modifications.keys())}")
         
         return modifications
     
-    def _start_render(self, modifications: dict) -> dict:
-        """Start a Creatomate render job."""
-        headers = {
-            "Authorization": f"Bearer {self.settings.creatomate_api_key}",
-            "Content-Type": "application/json",
-        }
+    async def _arequest(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Call the Creatomate API through the circuit breaker."""
+        _breaker.before_call()
+        try:
+            response = await get_async_http_client().request(
+                method, f"{self.BASE_URL}{path}", timeout=30.0, **kwargs
+            )
+        except httpx.HTTPError:
+            _breaker.record_failure()
+            raise
+        _breaker.record_response(response)
+        return response
+    
+    @staticmethod
+    def _first_render(response: httpx.Response) -> dict:
+        if response.status_code not in [200, 201, 202]:
+            raise Exception(f"Creatomate API error: {response.status_code} - {response.text}")
         
+        # Response is a list with one render
+        result = response.json()
+        if isinstance(result, list) and len(result) > 0:
+            return result[0]
+        return result
+    
+    async def _astart_render(self, modifications: dict) -> dict:
+        """Start a Creatomate render job (async)."""
         payload = {
             "template_id": self.settings.creatomate_template_id,
             "modifications": modifications,
         }
+        if self._webhook_url:
+            payload["webhook_url"] = self._webhook_url
         
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                f"{self.BASE_URL}/renders",
-                headers=headers,
-                json=payload,
-            )
-            
-            if response.status_code not in [200, 201, 202]:
-                raise Exception(f"Creatomate API error: {response.status_code} - {response.text}")
-            
-            # Response is a list with one render
-            result = response.json()
-            if isinstance(result, list) and len(result) > 0:
-                return result[0]
-            return result
-    
-    def _wait_for_render(self, render_id: str, max_wait: int = 300) -> dict:
-        """Poll for render completion."""
-        headers = {
-            "Authorization": f"Bearer {self.settings.creatomate_api_key}",
-        }
+        response = await self._arequest(
+            "POST",
+            "/renders",
+            headers=self._json_headers,
+            content=orjson.dumps(payload),
+        )
+        return self._first_render(response)
+    
+    async def _afetch_render(self, render_id: str) -> dict:
+        """Get a render's current state from Creatomate."""
+        response = await self._arequest("GET", f"/renders/{render_id}", headers=self._headers)
+        
+        if response.status_code != 200:
+            raise Exception(f"Failed to get render status: {response.text}")
         
-        waited = 0
-        poll_interval = 5
+        return response.json()
+    
+    async def aresolve_webhook(self, render_id: str) -> bool:
+        """
+        Complete a pending async render after a Creatomate webhook.
         
-        with httpx.Client(timeout=30.0) as client:
+        The callback body isn't trusted: the render is re-fetched from
+        Creatomate. Returns False if the render isn't awaited by this
+        process (or isn't finished yet); its poller will pick up the
+        result instead.
+        """
+        done = _pending_renders.get(render_id)
+        if done is None or done.done():
+            return False
+        
+        result = await self._afetch_render(render_id)
+        if result.get("status") not in RENDER_DONE_STATUSES or done.done():
+            return False
+        done.set_result(result)
+        return True
+    
+    async def _await_render(self, render_id: str, max_wait: int = 300) -> dict:
+        """
+        Wait for render completion without blocking a thread.
+        
+        Woken early by the Creatomate webhook when PUBLIC_BASE_URL and
+        CREATOMATE_WEBHOOK_SECRET are set; otherwise the usual status
+        polling finds the result.
+        """
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        _pending_renders[render_id] = done
+        waited = 0.0
+        attempt = 0
+        
+        try:
             while waited < max_wait:
-                response = client.get(
-                    f"{self.BASE_URL}/renders/{render_id}",
-                    headers=headers,
-                )
-                
-                if response.status_code != 200:
-                    raise Exception(f"Failed to get render status: {response.text}")
-                
-                result = response.json()
+                result = await self._afetch_render(render_id)
                 status = result.get("status")
                 
-                logger.info(f"Render status: {status} ({waited}s)")
+                logger.info(f"Render status: {status} ({waited:.0f}s)")
                 
-                if status == "succeeded":
-                    return result
-                elif status == "failed":
+                if status in RENDER_DONE_STATUSES:
                     return result
                 
-                time.sleep(poll_interval)
+                poll_interval = _poll_interval(attempt)
+                try:
+                    result = await asyncio.wait_for(asyncio.shield(done), poll_interval)
+                    logger.info(f"Render status via webhook: {result.get('status')}")
+                    return result
+                except asyncio.TimeoutError:
+                    pass
                 waited += poll_interval
+                attempt += 1
+        finally:
+            _pending_renders.pop(render_id, None)
         
         raise Exception("Render timed out")
     
-    def render_simple_short(
+    async def arender_simple_short(
         self,
         texts: List[str],
         audio_url: str,
@@ -204,12 +378,10 @@ class RenderService:
             audio_url: Voice-over audio URL
             background_video_url: Background video URL
         """
-        # Convert texts to segments
         segments = [{"text": text} for text in texts]
         
-        return self.render_short(
+        return await self.arender_short(
             script_segments=segments,
             audio_url=audio_url,
             background_video_url=background_video_url,
         )
-
@@ -4,14 +4,73 @@ Script Service - Generate video scripts using Claude.
 Structure: Observatie → Frictie → Reframe
 Tone: Rustig, constaterend, geen advies.
 """
-import json
+import hashlib
+import time
 import uuid
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-import anthropic
+import orjson
 from loguru import logger
 
 from app.config import get_settings
+from app.services.anthropic_client import get_anthropic_client, get_async_anthropic_client, log_prompt_cache
+
+
+# One script is ~25 words plus JSON scaffolding (~400 tokens)
+SCRIPT_MAX_TOKENS = 700
+
+# JSON schema of one script; Claude fills it in as a forced tool call, so
+# there's no free-form text to strip and decode
+SCRIPT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "full_text": {"type": "string"},
+        "segments": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"text": {"type": "string"}},
+                "required": ["text"],
+            },
+        },
+        "total_word_count": {"type": "integer"},
+        "total_duration_seconds": {"type": "integer"},
+    },
+    "required": ["title", "full_text", "segments"],
+}
+
+EMIT_SCRIPT_TOOL = {
+    "name": "emit_script",
+    "description": "Lever het 8-seconden script.",
+    "input_schema": SCRIPT_SCHEMA,
+}
+
+# Identical prompts reuse Claude's earlier reply for a day instead of paying
+# for another call; keyed by everything the model actually sees. Replies
+# are stored serialized so every hit builds a fresh script dict.
+SCRIPT_CACHE_TTL_SECONDS = 24 * 3600
+SCRIPT_CACHE_MAX_ENTRIES = 512
+_reply_cache: Dict[str, Tuple[float, bytes]] = {}
+
+
+def _reply_key(language: str, user_prompt: str) -> str:
+    return hashlib.blake2b(f"{language}\0{user_prompt}".encode(), digest_size=16).hexdigest()
+
+
+def _cached_reply(key: str) -> Optional[bytes]:
+    entry = _reply_cache.get(key)
+    if entry and time.monotonic() - entry[0] < SCRIPT_CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _remember_reply(key: str, content: bytes) -> None:
+    if len(_reply_cache) >= SCRIPT_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order: drop the oldest entry
+        _reply_cache.pop(next(iter(_reply_cache)))
+    _reply_cache[key] = (time.monotonic(), content)
 
 
 class ScriptService:
@@ -19,9 +78,14 @@ class ScriptService:
     
     def __init__(self):
         self.settings = get_settings()
-        self.client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
+        self.client = get_anthropic_client()
         self.model = "claude-sonnet-4-20250514"
     
+    @property
+    def aclient(self):
+        """Async Claude client for the current event loop."""
+        return get_async_anthropic_client()
+    
     def generate_script(
         self,
         topic: dict,
@@ -31,27 +95,81 @@ class ScriptService:
         """Generate a video script from a topic."""
         logger.info(f"Generating script for: {topic.get('title', 'Unknown')}")
         
-        system_prompt = self._build_system_prompt(language)
+        system_prompt = self._system_blocks(language)
         user_prompt = self._build_user_prompt(topic, target_duration)
+        cache_key = _reply_key(language, user_prompt)
+        cached = _cached_reply(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached script reply")
+            return self._build_script(orjson.loads(cached), topic)
         
         try:
-            response = self.client.messages.create(
+            message = self.client.messages.create(
                 model=self.model,
-                max_tokens=2000,
+                max_tokens=SCRIPT_MAX_TOKENS,
                 system=system_prompt,
+                tools=[EMIT_SCRIPT_TOOL],
+                tool_choice={"type": "tool", "name": EMIT_SCRIPT_TOOL["name"]},
                 messages=[{"role": "user", "content": user_prompt}]
             )
             
-            content = response.content[0].text
-            script = self._parse_script(content, topic)
+            return self._script_from_message(message, topic, cache_key)
+            
+        except Exception as e:
+            logger.error(f"Failed to generate script: {e}")
+            raise
+    
+    async def agenerate_script(
+        self,
+        topic: dict,
+        language: str = "nl",
+        target_duration: int = 8
+    ) -> dict:
+        """Async variant of generate_script."""
+        logger.info(f"Generating script for: {topic.get('title', 'Unknown')}")
+        
+        system_prompt = self._system_blocks(language)
+        user_prompt = self._build_user_prompt(topic, target_duration)
+        cache_key = _reply_key(language, user_prompt)
+        cached = _cached_reply(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached script reply")
+            return self._build_script(orjson.loads(cached), topic)
+        
+        try:
+            message = await self.aclient.messages.create(
+                model=self.model,
+                max_tokens=SCRIPT_MAX_TOKENS,
+                system=system_prompt,
+                tools=[EMIT_SCRIPT_TOOL],
+                tool_choice={"type": "tool", "name": EMIT_SCRIPT_TOOL["name"]},
+                messages=[{"role": "user", "content": user_prompt}]
+            )
             
-            return script
+            return self._script_from_message(message, topic, cache_key)
             
         except Exception as e:
             logger.error(f"Failed to generate script: {e}")
             raise
     
-    def _build_system_prompt(self, language: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _system_blocks(cls, language: str) -> List[dict]:
+        """
+        System prompt as a prompt-cached block, built once per language.
+        
+        The prompt text is identical on every call, so Claude can reuse the
+        cached prefix instead of re-processing it per request.
+        """
+        return [{
+            "type": "text",
+            "text": cls._build_system_prompt(language),
+            "cache_control": {"type": "ephemeral"},
+        }]
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _build_system_prompt(language: str) -> str:
         return """Je schrijft 8-seconden video scripts over de dagelijkse pijn van B2B sales.
 
 Doel: Laat de kijker denken "fuck, dat ben ik." Geen oplossing. Alleen de pijn.
@@ -239,45 +357,43 @@ VERBODEN:
 
 JSON output. Geen uitleg."""
 
-    def _parse_script(self, content: str, topic: dict) -> dict:
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
+    def _script_from_message(self, message, topic: dict, cache_key: str) -> dict:
+        """Build the script from the forced emit_script tool call."""
+        log_prompt_cache(message)
+        data = next(
+            (block.input for block in message.content if block.type == "tool_use"),
+            None
+        )
+        if not data:
+            logger.error("No emit_script tool call in response")
+            return self._fallback_script(topic)
         
-        try:
-            data = json.loads(content)
-            data["id"] = str(uuid.uuid4())
-            
-            # Ensure full_text exists
-            if "full_text" not in data:
-                segments = data.get("segments", [])
-                if segments:
-                    data["full_text"] = " ".join(
-                        seg.get("text", "") for seg in segments
-                    )
-                else:
-                    data["full_text"] = topic.get("opening_line", topic.get("hook", ""))
-            
-            # Calculate word count
-            if "total_word_count" not in data:
-                data["total_word_count"] = len(data["full_text"].split())
-            
-            # Add description
-            data["description"] = topic.get("core_observation", "")
-            
-            return data
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse script: {e}")
-            return {
-                "id": str(uuid.uuid4()),
-                "title": topic.get("title", ""),
-                "description": "",
-                "segments": [],
-                "full_text": topic.get("opening_line", topic.get("hook", "")),
-                "total_word_count": 0,
-                "total_duration_seconds": 30
-            }
+        _remember_reply(cache_key, orjson.dumps(data))
+        return self._build_script(data, topic)
+
+    def _build_script(self, data: dict, topic: dict) -> dict:
+        data["id"] = str(uuid.uuid4())
+        
+        # full_text is required by SCRIPT_SCHEMA; the hook only covers a
+        # tool call that ignored the schema
+        data.setdefault("full_text", topic.get("hook", ""))
+        
+        # Calculate word count
+        if "total_word_count" not in data:
+            data["total_word_count"] = len(data["full_text"].split())
+        
+        # Add description
+        data["description"] = topic.get("core_observation", "")
+        
+        return data
+
+    def _fallback_script(self, topic: dict) -> dict:
+        return {
+            "id": str(uuid.uuid4()),
+            "title": topic.get("title", ""),
+            "description": "",
+            "segments": [],
+            "full_text": topic.get("opening_line", topic.get("hook", "")),
+            "total_word_count": 0,
+            "total_duration_seconds": 30
+        }
@@ -3,15 +3,16 @@ Topic Service - Generate B2B sales content using Claude.
 
 Philosophy: Observation beats advice. Framing beats tactics. Clarity beats hype.
 """
-import json
 import uuid
+from functools import lru_cache
 from typing import List, Optional
 from enum import Enum
 
-import anthropic
 from loguru import logger
 
 from app.config import get_settings
+from app.services.anthropic_client import get_anthropic_client, get_async_anthropic_client
+from app.services.json_reply import JSONDecodeError, loads_reply, reply_text
 
 
 class ContentType(str, Enum):
@@ -28,9 +29,14 @@ class TopicService:
     
     def __init__(self):
         self.settings = get_settings()
-        self.client = anthropic.Anthropic(api_key=self.settings.anthropic_api_key)
+        self.client = get_anthropic_client()
         self.model = "claude-sonnet-4-20250514"
     
+    @property
+    def aclient(self):
+        """Async Claude client for the current event loop."""
+        return get_async_anthropic_client()
+    
     def generate_topics(
         self,
         content_type: Optional[ContentType] = None,
@@ -40,7 +46,7 @@ class TopicService:
         """Generate B2B sales topic ideas."""
         logger.info(f"Generating {count} topics (type={content_type}, lang={language})")
         
-        system_prompt = self._build_system_prompt(language)
+        system_prompt = self._system_blocks(language)
         user_prompt = self._build_user_prompt(content_type, count, language)
         
         try:
@@ -51,7 +57,37 @@ class TopicService:
                 messages=[{"role": "user", "content": user_prompt}]
             )
             
-            content = response.content[0].text
+            content = reply_text(response)
+            topics = self._parse_topics(content)
+            
+            logger.info(f"Generated {len(topics)} topics")
+            return topics
+            
+        except Exception as e:
+            logger.error(f"Failed to generate topics: {e}")
+            raise
+    
+    async def agenerate_topics(
+        self,
+        content_type: Optional[ContentType] = None,
+        count: int = 1,
+        language: str = "nl"
+    ) -> List[dict]:
+        """Async variant of generate_topics, for use from request handlers."""
+        logger.info(f"Generating {count} topics (type={content_type}, lang={language})")
+        
+        system_prompt = self._system_blocks(language)
+        user_prompt = self._build_user_prompt(content_type, count, language)
+        
+        try:
+            response = await self.aclient.messages.create(
+                model=self.model,
+                max_tokens=2000,
+                system=system_prompt,
+                messages=[{"role": "user", "content": user_prompt}]
+            )
+            
+            content = reply_text(response)
             topics = self._parse_topics(content)
             
             logger.info(f"Generated {len(topics)} topics")
@@ -61,7 +97,24 @@ class TopicService:
             logger.error(f"Failed to generate topics: {e}")
             raise
     
-    def _build_system_prompt(self, language: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _system_blocks(cls, language: str) -> List[dict]:
+        """
+        System prompt as a prompt-cached block, built once per language.
+        
+        The prompt text is identical on every call, so Claude can reuse the
+        cached prefix instead of re-processing it per request.
+        """
+        return [{
+            "type": "text",
+            "text": cls._build_system_prompt(language),
+            "cache_control": {"type": "ephemeral"},
+        }]
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _build_system_prompt(language: str) -> str:
         return f"""Je maakt topics voor 8-seconden B2B sales video's.
 
 Doel: Raak de dagelijkse pijn van B2B verkopers. Laat ze voelen: "dit is mijn leven."
@@ -176,29 +229,24 @@ Iets waar een verkoper bij denkt: "fuck, dat is precies wat ik doe."
 JSON output. Geen uitleg."""
 
     def _parse_topics(self, content: str) -> List[dict]:
-        content = content.strip()
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
-        
         try:
-            data = json.loads(content)
+            data = loads_reply(content)
             if isinstance(data, dict):
                 data = [data]
-            for item in data:
-                item["id"] = str(uuid.uuid4())
-                # Map new format to expected fields
-                item["title"] = item.get("title", "Untitled")
-                item["hook"] = item.get("hook", "")
-                item["full_text"] = item.get("full_script", "")
-                item["content_type"] = item.get("pain_type", "research_hell")
-                # Backward compatibility
-                item["main_points"] = [item.get("scene", "")]
-                item["cta"] = item.get("sting", "")
-                item["hashtags"] = ["b2bsales", "sales"]
-            return data
-        except json.JSONDecodeError as e:
+            return [self._build_topic(item) for item in data]
+        except JSONDecodeError as e:
             logger.error(f"Failed to parse topics: {e}")
             return []
+
+    def _build_topic(self, item: dict) -> dict:
+        item["id"] = str(uuid.uuid4())
+        # Map new format to expected fields
+        item["title"] = item.get("title", "Untitled")
+        item["hook"] = item.get("hook", "")
+        item["full_text"] = item.get("full_script", "")
+        item["content_type"] = item.get("pain_type", "research_hell")
+        # Backward compatibility
+        item["main_points"] = [item.get("scene", "")]
+        item["cta"] = item.get("sting", "")
+        item["hashtags"] = ["b2bsales", "sales"]
+        return item
@@ -1,10 +1,10 @@
 """
 TTS Service - Generate voice-overs using ElevenLabs.
 """
-import httpx
 from loguru import logger
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
 
 
 class TTSService:
@@ -16,6 +16,7 @@ class TTSService:
         self.settings = get_settings()
         self.api_key = self.settings.elevenlabs_api_key
         self.voice_id = self.settings.elevenlabs_voice_id
+        self._http = get_http_client()
     
     def generate_audio(
         self,
@@ -47,37 +48,35 @@ class TTSService:
             "model_id": "eleven_multilingual_v2"
         }
         
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(url, headers=headers, json=payload)
-            
-            if response.status_code != 200:
-                error_detail = response.text
-                logger.error(f"ElevenLabs error {response.status_code}: {error_detail}")
-                raise Exception(f"ElevenLabs error: {response.status_code} - {error_detail}")
-            
-            audio_bytes = response.content
-            logger.info(f"Audio generated: {len(audio_bytes)} bytes")
-            
-            # Upload to Supabase Storage
-            from app.services.storage_service import StorageService
-            storage = StorageService()
-            audio_url = storage.upload_audio(audio_bytes)
-            
-            return audio_url
+        response = self._http.post(url, headers=headers, json=payload)
+        
+        if response.status_code != 200:
+            error_detail = response.text
+            logger.error(f"ElevenLabs error {response.status_code}: {error_detail}")
+            raise Exception(f"ElevenLabs error: {response.status_code} - {error_detail}")
+        
+        audio_bytes = response.content
+        logger.info(f"Audio generated: {len(audio_bytes)} bytes")
+        
+        # Upload to Supabase Storage
+        from app.services.storage_service import StorageService
+        storage = StorageService()
+        audio_url = storage.upload_audio(audio_bytes)
+        
+        return audio_url
     
     def get_voices(self) -> list:
         """Get available voices."""
         if not self.api_key:
             raise ValueError("ElevenLabs API key not configured")
         
-        with httpx.Client() as client:
-            response = client.get(
-                f"{self.BASE_URL}/voices",
-                headers={"xi-api-key": self.api_key}
-            )
-            
-            if response.status_code != 200:
-                raise Exception(f"Failed to get voices: {response.text}")
-            
-            return response.json().get("voices", [])
+        response = self._http.get(
+            f"{self.BASE_URL}/voices",
+            headers={"xi-api-key": self.api_key}
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Failed to get voices: {response.text}")
+        
+        return response.json().get("voices", [])
 
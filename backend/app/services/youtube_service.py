@@ -3,11 +3,12 @@ YouTube Service - Upload videos to YouTube.
 """
 import os
 import tempfile
+import threading
 from typing import List
-import httpx
 from loguru import logger
 
-from app.config import get_settings
+from app.config import BRAND, get_settings
+from app.services.http_client import get_http_client
 
 
 class YouTubeService:
@@ -15,10 +16,20 @@ class YouTubeService:
     
     def __init__(self):
         self.settings = get_settings()
-        self._youtube = None
+        # httplib2 connections aren't thread-safe, so keep one API client
+        # (and its connection) per thread
+        self._local = threading.local()
+        self._http = get_http_client()
     
     def _get_youtube_client(self):
-        """Get authenticated YouTube API client."""
+        """Get authenticated YouTube API client (built once per thread)."""
+        youtube = getattr(self._local, "youtube", None)
+        if youtube is None:
+            youtube = self._local.youtube = self._build_youtube_client()
+        return youtube
+    
+    def _build_youtube_client(self):
+        """Build an authenticated YouTube API client."""
         from googleapiclient.discovery import build
         from google.oauth2.credentials import Credentials
         
@@ -127,8 +138,8 @@ class YouTubeService:
             body = {
                 "snippet": {
                     "title": title[:100],  # Max 100 chars
-                    "description": f"{description}\n\n🚀 {self.settings.brand_website}",
-                    "tags": tags or ["sales", "AI", "B2B", self.settings.brand_name],
+                    "description": f"{description}\n\n🚀 {BRAND.website}",
+                    "tags": tags or ["sales", "AI", "B2B", BRAND.name],
                     "categoryId": "22",  # People & Blogs
                 },
                 "status": {
@@ -170,17 +181,16 @@ class YouTubeService:
     
     def _download_video(self, video_url: str) -> str:
         """Download video from URL to temp file."""
-        with httpx.Client(timeout=120.0) as client:
-            response = client.get(video_url)
-            response.raise_for_status()
-            
-            # Save to temp file
-            fd, temp_path = tempfile.mkstemp(suffix=".mp4")
-            with os.fdopen(fd, 'wb') as f:
-                f.write(response.content)
-            
-            logger.info(f"Video downloaded to: {temp_path} ({len(response.content)} bytes)")
-            return temp_path
+        response = self._http.get(video_url, timeout=120.0)
+        response.raise_for_status()
+        
+        # Save to temp file
+        fd, temp_path = tempfile.mkstemp(suffix=".mp4")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(response.content)
+        
+        logger.info(f"Video downloaded to: {temp_path} ({len(response.content)} bytes)")
+        return temp_path
     
     def get_channel_videos(self, max_results: int = 20) -> List[dict]:
         """Get recent videos from the channel."""
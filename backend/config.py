@@ -2,12 +2,25 @@
 Configuration management for DealMotion Marketing Engine
 """
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
 
+@dataclass(frozen=True, slots=True)
+class BrandConstants:
+    """Static brand information (identical across environments)."""
+    name: str = "DealMotion"
+    website: str = "https://dealmotion.ai"
+    tagline: str = "Put your deals in motion"
+
+
+BRAND = BrandConstants()
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -43,9 +56,6 @@ class Settings(BaseSettings):
     # Content Settings
     # ==========================================================================
     default_language: str = Field(default="nl", description="Default content language")
-    brand_name: str = Field(default="DealMotion", description="Brand name")
-    brand_website: str = Field(default="https://dealmotion.ai", description="Brand website")
-    brand_tagline: str = Field(default="Put your deals in motion", description="Brand tagline")
     
     # ==========================================================================
     # Scheduling
@@ -87,11 +97,8 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache()
 def get_settings() -> Settings:
-    """Get settings instance."""
-    return settings
+    """Get cached settings instance (loaded on first use)."""
+    return Settings()
 
@@ -26,7 +26,7 @@ from loguru import logger
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from backend.config import get_settings
+from backend.config import BRAND, get_settings
 from backend.agents.topic_agent import TopicAgent, TopicIdea
 from backend.agents.script_agent import ScriptAgent, VideoScript
 from backend.services.tts_service import TTSService
@@ -177,8 +177,8 @@ class DailyPipeline:
         request = VideoUploadRequest(
             video_path=video_path,
             title=script.title,
-            description=f"{script.description}\n\n🚀 {self.settings.brand_website}",
-            tags=script.topic.hashtags + ["sales", "AI", "B2B", self.settings.brand_name],
+            description=f"{script.description}\n\n🚀 {BRAND.website}",
+            tags=script.topic.hashtags + ["sales", "AI", "B2B", BRAND.name],
             is_short=True
         )
         
@@ -5,6 +5,7 @@ NanoBanana is used for generating faceless video content.
 Documentation: https://nanobananavideo.com
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 from datetime import datetime
@@ -251,7 +252,8 @@ class MockNanoBananaService(NanoBananaService):
         )
 
 
-# Factory function
+# Factory function (cached, so callers share one instance per mode)
+@lru_cache(maxsize=2)
 def get_nanobanana_service(mock: bool = False) -> NanoBananaService:
     """Get NanoBanana service instance."""
     if mock:
@@ -2,6 +2,7 @@
 Text-to-Speech Service - Generates voice-overs using ElevenLabs.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -137,6 +138,12 @@ class TTSService:
             return response.json()
 
 
+@lru_cache(maxsize=1)
+def _get_service() -> TTSService:
+    """Get the shared TTSService used by the convenience function."""
+    return TTSService()
+
+
 # Convenience function for sync usage
 def generate_audio_sync(
     text: str,
@@ -146,6 +153,5 @@ def generate_audio_sync(
     """Synchronous wrapper for audio generation."""
     import asyncio
     
-    service = TTSService()
-    return asyncio.run(service.generate_audio(text, output_path, voice_id))
+    return asyncio.run(_get_service().generate_audio(text, output_path, voice_id))
 
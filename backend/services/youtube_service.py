@@ -2,6 +2,7 @@
 YouTube Service - Upload and manage YouTube videos.
 """
 import os
+from functools import lru_cache
 import pickle
 from pathlib import Path
 from typing import Optional, List
@@ -241,7 +242,8 @@ class MockYouTubeService(YouTubeService):
         )
 
 
-# Factory function
+# Factory function (cached, so callers share one instance per mode)
+@lru_cache(maxsize=2)
 def get_youtube_service(mock: bool = False) -> YouTubeService:
     """Get YouTube service instance."""
     if mock:
@@ -0,0 +1,9 @@
+"""
+Put backend/ on sys.path so the FastAPI app's "app.*" imports resolve.
+"""
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
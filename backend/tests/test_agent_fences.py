@@ -0,0 +1,31 @@
+"""
+Code-fence stripping for the legacy agents' Claude replies.
+"""
+import pytest
+
+from backend.agents.json_reply import strip_code_fence
+
+FENCE = "```"
+PAYLOAD = '{"title": "x", "segments": []}'
+
+
+@pytest.mark.parametrize("reply", [
+    f"{FENCE}json\n{PAYLOAD}\n{FENCE}",
+    f"{FENCE}\n{PAYLOAD}\n{FENCE}",
+    f"  {FENCE}json\n{PAYLOAD}\n{FENCE}  \n",
+], ids=["json-fence", "bare-fence", "surrounding-whitespace"])
+def test_fenced_reply(reply):
+    assert strip_code_fence(reply) == PAYLOAD
+
+
+def test_fenced_reply_with_trailing_text():
+    reply = f"{FENCE}json\n{PAYLOAD}\n{FENCE}\n\nLet me know if you want changes."
+    assert strip_code_fence(reply) == PAYLOAD
+
+
+def test_unclosed_fence():
+    assert strip_code_fence(f"{FENCE}json\n{PAYLOAD}\n") == PAYLOAD
+
+
+def test_unfenced_reply():
+    assert strip_code_fence(f"\n  {PAYLOAD}  \n") == PAYLOAD
@@ -0,0 +1,45 @@
+"""
+Splitting script text across the 4 Creatomate caption scenes.
+"""
+from app.inngest.functions import _four_caption_texts, _split_text_into_four
+
+
+def test_split_empty_text():
+    assert _split_text_into_four("") == ("", "", "", "")
+
+
+def test_split_short_text():
+    assert _split_text_into_four("Hi there") == ("Hi", "there", "", "")
+
+
+def test_split_text_without_spaces():
+    word = "Verkoopgesprekvoorbereiding"
+    assert _split_text_into_four(word) == (word, "", "", "")
+
+
+def test_split_keeps_words_whole_and_in_order():
+    text = "Stop met pitchen en begin met luisteren naar wat je klant echt nodig heeft"
+    parts = _split_text_into_four(text)
+    assert len(parts) == 4
+    assert all(parts)
+    assert " ".join(parts).split() == text.split()
+
+
+def test_captions_from_segments_are_padded_to_four():
+    script = {"segments": [{"text": "Hook"}, {"text": "Punt"}], "full_text": "ignored"}
+    assert _four_caption_texts(script) == ["Hook", "Punt", "", ""]
+
+
+def test_captions_take_only_the_first_four_segments():
+    script = {"segments": [{"text": str(i)} for i in range(6)]}
+    assert _four_caption_texts(script) == ["0", "1", "2", "3"]
+
+
+def test_captions_fall_back_to_full_text():
+    script = {"segments": [{"text": ""}], "full_text": "Hi there"}
+    assert _four_caption_texts(script) == ["Hi", "there", "", ""]
+
+
+def test_captions_for_empty_script():
+    assert _four_caption_texts({}) == ["", "", "", ""]
+    assert _four_caption_texts({"segments": None, "full_text": None}) == ["", "", "", ""]
@@ -0,0 +1,105 @@
+"""
+State transitions of the Creatomate circuit breaker.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import render_service
+from app.services.render_service import CircuitBreaker, RenderServiceUnavailable
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(t=1000.0)
+    monkeypatch.setattr(render_service, "time", SimpleNamespace(monotonic=lambda: now.t))
+    return now
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(fail_max=3, window=60.0, reset_timeout=30.0)
+
+
+def _allowed(breaker: CircuitBreaker) -> bool:
+    try:
+        breaker.before_call()
+    except RenderServiceUnavailable:
+        return False
+    return True
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.fail_max):
+        breaker.record_failure()
+
+
+def test_closed_until_fail_max(breaker):
+    for _ in range(breaker.fail_max - 1):
+        breaker.record_failure()
+    assert _allowed(breaker)
+
+
+def test_success_resets_failure_count(breaker):
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert _allowed(breaker)
+
+
+def test_failures_outside_window_dont_add_up(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.t += breaker.window + 1
+    breaker.record_failure()
+    assert _allowed(breaker)
+
+
+def test_opens_after_fail_max(breaker, clock):
+    _open(breaker)
+    assert not _allowed(breaker)
+    clock.t += breaker.reset_timeout - 1
+    assert not _allowed(breaker)
+
+
+def test_half_open_lets_a_single_trial_through(breaker, clock):
+    _open(breaker)
+    clock.t += breaker.reset_timeout
+    assert _allowed(breaker)
+    assert not _allowed(breaker)
+    assert not _allowed(breaker)
+
+
+def test_successful_trial_closes(breaker, clock):
+    _open(breaker)
+    clock.t += breaker.reset_timeout
+    assert _allowed(breaker)
+    breaker.record_success()
+    assert _allowed(breaker)
+    assert _allowed(breaker)
+
+
+def test_failed_trial_reopens(breaker, clock):
+    _open(breaker)
+    clock.t += breaker.reset_timeout
+    assert _allowed(breaker)
+    breaker.record_failure()
+    assert not _allowed(breaker)
+    clock.t += breaker.reset_timeout
+    assert _allowed(breaker)
+
+
+def test_lost_trial_allows_another_after_reset_timeout(breaker, clock):
+    _open(breaker)
+    clock.t += breaker.reset_timeout
+    assert _allowed(breaker)
+    clock.t += breaker.reset_timeout
+    assert _allowed(breaker)
+
+
+@pytest.mark.parametrize("status_code, allowed", [(200, True), (404, True), (503, False)])
+def test_record_response_counts_only_5xx(breaker, status_code, allowed):
+    for _ in range(breaker.fail_max):
+        breaker.record_response(SimpleNamespace(status_code=status_code))
+    assert _allowed(breaker) is allowed
@@ -0,0 +1,95 @@
+"""
+Flushing and failure propagation of the Inngest EventBatcher.
+"""
+import asyncio
+
+import pytest
+
+from app.inngest import batcher as batcher_module
+from app.inngest.batcher import EventBatcher
+
+
+class FakeInngestClient:
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.batches = []
+
+    async def send(self, events):
+        if self.error is not None:
+            raise self.error
+        self.batches.append(list(events))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeInngestClient()
+    monkeypatch.setattr(batcher_module, "inngest_client", fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full(client):
+    batcher = EventBatcher(max_size=3, max_wait=60)
+    # Would hang for max_wait if a full batch didn't flush right away
+    await asyncio.wait_for(asyncio.gather(*(batcher.put(i) for i in range(3))), 1)
+    assert client.batches == [[0, 1, 2]]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_splits_into_max_size_batches(client):
+    batcher = EventBatcher(max_size=2, max_wait=0.01)
+    await asyncio.wait_for(asyncio.gather(*(batcher.put(i) for i in range(5))), 1)
+    assert client.batches == [[0, 1], [2, 3], [4]]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_max_wait(client):
+    batcher = EventBatcher(max_size=100, max_wait=0.01)
+    await asyncio.wait_for(batcher.put("a"), 1)
+    assert client.batches == [["a"]]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_events(client):
+    batcher = EventBatcher(max_size=100, max_wait=60)
+    puts = [asyncio.create_task(batcher.put(i)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert client.batches == []
+
+    await asyncio.wait_for(batcher.close(), 1)
+
+    assert client.batches == [[0, 1, 2]]
+    await asyncio.gather(*puts)
+
+
+@pytest.mark.asyncio
+async def test_put_after_close_restarts_consumer(client):
+    batcher = EventBatcher(max_size=100, max_wait=0.01)
+    await batcher.put("a")
+    await batcher.close()
+    await asyncio.wait_for(batcher.put("b"), 1)
+    assert client.batches == [["a"], ["b"]]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_close_without_events_is_a_no_op(client):
+    await EventBatcher().close()
+    assert client.batches == []
+
+
+@pytest.mark.asyncio
+async def test_send_failure_raises_in_every_put(client):
+    client.error = RuntimeError("inngest down")
+    batcher = EventBatcher(max_size=100, max_wait=0.01)
+    results = await asyncio.gather(batcher.put(1), batcher.put(2), return_exceptions=True)
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+    # The consumer survives a failed send
+    client.error = None
+    await asyncio.wait_for(batcher.put(3), 1)
+    assert client.batches == [[3]]
+    await batcher.close()
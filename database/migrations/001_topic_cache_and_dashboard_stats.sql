@@ -0,0 +1,34 @@
+-- ============================================================
+-- Migration 001 - topic_cache table + get_dashboard_stats RPC
+-- ============================================================
+-- For Supabase projects created from an older schema.sql; new projects
+-- get both objects from schema.sql. Safe to run more than once.
+
+-- Generated topics + scripts per day (idempotency)
+CREATE TABLE IF NOT EXISTS topic_cache (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    run_date DATE NOT NULL,
+    language TEXT NOT NULL DEFAULT 'nl',
+    content_type TEXT NOT NULL DEFAULT 'mixed',
+    items JSONB NOT NULL DEFAULT '[]'::jsonb,  -- [{"topic": {...}, "script": {...}}]
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE (run_date, language, content_type)
+);
+
+-- Dashboard stats, aggregated in one round trip
+CREATE OR REPLACE FUNCTION get_dashboard_stats(week_start TIMESTAMPTZ)
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'total_videos', (SELECT COUNT(*) FROM videos),
+        'total_views', (SELECT COALESCE(SUM(views), 0) FROM youtube_uploads),
+        'videos_this_week', (SELECT COUNT(*) FROM videos WHERE created_at >= week_start),
+        'content_mix', (
+            SELECT COALESCE(json_object_agg(content_type, n), '{}'::json)
+            FROM (
+                SELECT COALESCE(content_type, 'unknown') AS content_type, COUNT(*) AS n
+                FROM topics
+                GROUP BY 1
+            ) mix
+        )
+    );
+$$ LANGUAGE sql STABLE;
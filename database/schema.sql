@@ -11,13 +11,13 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- ============================================================
 CREATE TABLE IF NOT EXISTS topics (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    content_type TEXT NOT NULL,  -- sales_tip, ai_news, hot_take, product_showcase
+    content_type TEXT NOT NULL DEFAULT 'sales_tip',  -- sales_tip, ai_news, hot_take, product_showcase
     title TEXT NOT NULL,
     hook TEXT NOT NULL,
     main_points JSONB DEFAULT '[]'::jsonb,
     cta TEXT,
     hashtags JSONB DEFAULT '[]'::jsonb,
-    estimated_duration_seconds INTEGER DEFAULT 45,
+    estimated_duration_seconds INTEGER DEFAULT 25,
     language TEXT DEFAULT 'nl',
     status TEXT DEFAULT 'pending',  -- pending, used, archived
     created_at TIMESTAMPTZ DEFAULT NOW(),
@@ -38,7 +38,7 @@ CREATE TABLE IF NOT EXISTS scripts (
     description TEXT,
     segments JSONB DEFAULT '[]'::jsonb,
     full_text TEXT,
-    total_duration_seconds FLOAT DEFAULT 45,
+    total_duration_seconds FLOAT DEFAULT 25,
     language TEXT DEFAULT 'nl',
     status TEXT DEFAULT 'pending',  -- pending, used, archived
     created_at TIMESTAMPTZ DEFAULT NOW(),
@@ -139,6 +139,19 @@ INSERT INTO settings (key, value, description) VALUES
 ('content_mix', '{"sales_tip": 40, "ai_news": 25, "hot_take": 20, "product_showcase": 15}', 'Content type distribution (percentage)')
 ON CONFLICT (key) DO NOTHING;
 
+-- ============================================================
+-- 7. TOPIC_CACHE - Generated topics + scripts per day (idempotency)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS topic_cache (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    run_date DATE NOT NULL,
+    language TEXT NOT NULL DEFAULT 'nl',
+    content_type TEXT NOT NULL DEFAULT 'mixed',
+    items JSONB NOT NULL DEFAULT '[]'::jsonb,  -- [{"topic": {...}, "script": {...}}]
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE (run_date, language, content_type)
+);
+
 -- ============================================================
 -- FUNCTIONS
 -- ============================================================
@@ -164,6 +177,24 @@ CREATE TRIGGER youtube_uploads_updated_at BEFORE UPDATE ON youtube_uploads
 CREATE TRIGGER settings_updated_at BEFORE UPDATE ON settings
     FOR EACH ROW EXECUTE FUNCTION update_updated_at();
 
+-- Dashboard stats, aggregated in one round trip
+CREATE OR REPLACE FUNCTION get_dashboard_stats(week_start TIMESTAMPTZ)
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'total_videos', (SELECT COUNT(*) FROM videos),
+        'total_views', (SELECT COALESCE(SUM(views), 0) FROM youtube_uploads),
+        'videos_this_week', (SELECT COUNT(*) FROM videos WHERE created_at >= week_start),
+        'content_mix', (
+            SELECT COALESCE(json_object_agg(content_type, n), '{}'::json)
+            FROM (
+                SELECT COALESCE(content_type, 'unknown') AS content_type, COUNT(*) AS n
+                FROM topics
+                GROUP BY 1
+            ) mix
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
 -- ============================================================
 -- VIEWS
 -- ============================================================
@@ -28,7 +28,7 @@ from loguru import logger
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.config import get_settings
+from backend.config import BRAND, get_settings
 from backend.agents.topic_agent import TopicAgent, ContentType
 from backend.agents.script_agent import ScriptAgent
 from backend.services.tts_service import TTSService
@@ -148,8 +148,8 @@ async def generate_short(
             upload_request = VideoUploadRequest(
                 video_path=video_result.video_path,
                 title=script.title,
-                description=f"{script.description}\n\n🚀 {settings.brand_website}",
-                tags=topic.hashtags + ["sales", "AI", "B2B", settings.brand_name],
+                description=f"{script.description}\n\n🚀 {BRAND.website}",
+                tags=topic.hashtags + ["sales", "AI", "B2B", BRAND.name],
                 is_short=True
             )
             